@@ -29,10 +29,30 @@ from .models import (
     SlotKind,
     Topic,
 )
+from .similarity import PaperTopicScores
 
 logger = logging.getLogger(__name__)
 
 
+# CP-SAT parameter presets, applied on top of the solver defaults.
+# "balanced" is the historical configuration.
+_CP_PRESETS: dict[str, dict[str, object]] = {
+    "fast": {
+        "max_time_in_seconds": 30.0,
+        "cp_model_presolve": False,
+        "cp_model_probing_level": 0,
+        "linearization_level": 0,
+    },
+    "balanced": {
+        "max_time_in_seconds": 120.0,
+    },
+    "quality": {
+        "max_time_in_seconds": 600.0,
+        "optimize_with_core": True,
+    },
+}
+
+
 # ---------------------------------------------------------------------------
 # Capacity pre-flight check
 # ---------------------------------------------------------------------------
@@ -76,11 +96,7 @@ def check_capacity(
 
     Returns a CapacityReport with diagnostics and suggestions.
     """
-    sessions = _collect_sessions(program)
-    caps = [_session_capacity(s, cfg) for s in sessions]
-    usable = [(j, c) for j, c in enumerate(caps) if not sessions[j].is_fixed]
-    total_cap = sum(c for _, c in usable)
-    n_sessions = len(usable)
+    n_sessions, total_cap = _usable_capacity(program, cfg)
     deficit = n_papers - total_cap
 
     suggestions: list[str] = []
@@ -119,6 +135,20 @@ def check_capacity(
     )
 
 
+def check_capacity_fast(
+    program: Program,
+    n_papers: int,
+    cfg: ScheduleConfig,
+) -> tuple[bool, int, int]:
+    """Cheap variant of :func:`check_capacity` for when nobody reads the report.
+
+    Returns ``(feasible, total_capacity, n_papers)`` without building
+    suggestions or any other diagnostics.
+    """
+    _n_sessions, total_cap = _usable_capacity(program, cfg)
+    return n_papers <= total_cap, total_cap, n_papers
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -131,6 +161,16 @@ def _session_capacity(session: Session, cfg: ScheduleConfig) -> int:
     return dur // cfg.presentation_duration_min
 
 
+def _usable_capacity(program: Program, cfg: ScheduleConfig) -> tuple[int, int]:
+    """Return ``(n_sessions, total_capacity)`` over the non-fixed sessions."""
+    n_sessions = total_cap = 0
+    for session in _collect_sessions(program):
+        if not session.is_fixed:
+            n_sessions += 1
+            total_cap += _session_capacity(session, cfg)
+    return n_sessions, total_cap
+
+
 def _collect_sessions(program: Program) -> list[Session]:
     """Flatten all SESSION-type slots into a list of Session objects."""
     sessions: list[Session] = []
@@ -206,7 +246,7 @@ def _paper_topic_score(
     paper: Paper,
     topic_id: int,
     topic_groups: dict[int, list[int]],
-    sbert_scores: Optional[dict[int, dict[int, float]]] = None,
+    sbert_scores: Optional[PaperTopicScores] = None,
     topic_sim_matrix: Optional[np.ndarray] = None,
     tid_list: Optional[list[int]] = None,
 ) -> int:
@@ -224,9 +264,7 @@ def _paper_topic_score(
 
     # Direct SBERT paper-topic score
     if sbert_scores and paper.paper_id in sbert_scores:
-        pscores = sbert_scores[paper.paper_id]
-        best = max((pscores.get(tid, 0.0) for tid in member_tids), default=0.0)
-        return int(best * 100)
+        return int(sbert_scores.best(paper.paper_id, member_tids) * 100)
 
     # Direct preference match
     for rank, weight in enumerate([100, 60]):
@@ -395,7 +433,7 @@ def _assign_topics_to_sessions(
     topics: list[Topic],
     topic_groups: dict[int, list[int]],
     caps: list[int],
-    sbert_scores: Optional[dict[int, dict[int, float]]] = None,
+    sbert_scores: Optional[PaperTopicScores] = None,
     topic_diversity: bool = True,
 ) -> dict[int, int]:
     """Greedily assign a canonical topic to each non-fixed session.
@@ -527,18 +565,30 @@ def assign_papers(
     papers: list[Paper],
     topics: list[Topic],
     cfg: ScheduleConfig,
-    sbert_scores: Optional[dict[int, dict[int, float]]] = None,
+    sbert_scores: Optional[PaperTopicScores | dict[int, dict[int, float]]] = None,
     topic_sim_matrix: Optional[np.ndarray] = None,
     merge_threshold: float = 0.75,
     min_group_size: int = 3,
+    num_workers: int = 8,
+    preset: str = "balanced",
 ) -> Program:
     """Assign papers to sessions in *program*.
 
     Phase 1: greedy topic→session assignment.
     Phase 2: CP-SAT paper→session assignment maximising topic affinity.
 
+    *sbert_scores* may also be given as a nested
+    ``{paper_id: {topic_id: score}}`` dict.  *num_workers* is the number
+    of parallel CP-SAT search workers (0 lets OR-Tools use every core);
+    *preset* picks a solver parameter set from ``_CP_PRESETS``
+    (``"fast"``, ``"balanced"`` or ``"quality"``).
+
     Returns the modified Program.
     """
+    if preset not in _CP_PRESETS:
+        raise ValueError(f"Unknown CP-SAT preset {preset!r}; choose from {list(_CP_PRESETS)}")
+    if isinstance(sbert_scores, dict):
+        sbert_scores = PaperTopicScores.from_dict(sbert_scores)
     sessions = _collect_sessions(program)
     if not sessions:
         raise ValueError("No sessions found in the programme.")
@@ -793,8 +843,10 @@ def assign_papers(
 
     # Solve
     solver = cp_model.CpSolver()
-    solver.parameters.max_time_in_seconds = 120
-    solver.parameters.num_workers = 8
+    for name, value in _CP_PRESETS[preset].items():
+        setattr(solver.parameters, name, value)
+    solver.parameters.num_workers = num_workers
+    solver.parameters.log_search_progress = logger.isEnabledFor(logging.DEBUG)
     status = solver.solve(model)
 
     if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
 import sys
 from pathlib import Path
 
@@ -35,13 +36,176 @@ def _load_mapping(path: str):
     return load_column_mapping(path)
 
 
+# Parsed paper lists, pickled per (papers CSV, mapping) pair
+_PAPERS_CACHE_DIR = Path(".cache") / "papers"
+# Part of every cache stamp: bump whenever Paper/Author or what
+# load_papers produces changes, so older pickles are re-parsed
+_PAPERS_CACHE_VERSION = 1
+
+
+def _load_papers(papers_path: str, mapping_path: str):
+    """``load_papers`` with an on-disk cache for back-to-back invocations.
+
+    The pickle is reused while both input files keep their size and
+    mtime and ``_PAPERS_CACHE_VERSION`` is unchanged; any error reading it
+    falls back to parsing the CSV.
+    """
+    import hashlib
+    import pickle
+
+    stamp = (_PAPERS_CACHE_VERSION,) + tuple(
+        (st.st_mtime_ns, st.st_size) for st in (os.stat(papers_path), os.stat(mapping_path))
+    )
+    key = hashlib.sha1(
+        f"{Path(papers_path).resolve()}\x00{Path(mapping_path).resolve()}".encode("utf-8")
+    ).hexdigest()
+    cache = _PAPERS_CACHE_DIR / f"papers_{key}.pkl"
+    try:
+        with open(cache, "rb") as fh:
+            cached_stamp, papers = pickle.load(fh)
+        if cached_stamp == stamp:
+            logger.debug("Papers loaded from cache %s", cache)
+            return papers
+    except Exception:
+        pass
+
+    from cpm.data_prep import load_papers
+
+    papers = load_papers(papers_path, _load_mapping(mapping_path))
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as fh:
+            pickle.dump((stamp, papers), fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache)
+    except OSError as exc:
+        logger.debug("Could not write papers cache %s: %s", cache, exc)
+    return papers
+
+
 def _load_program(path: str):
     from cpm.models import Program
     return Program.load(path)
 
 
+# Parent directories already created during this run (reset by main())
+_ENSURED: set[str] = set()
+
+
 def _ensure_dir(path: str):
-    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    parent = str(Path(path).parent)
+    if parent in _ENSURED:
+        return
+    Path(parent).mkdir(parents=True, exist_ok=True)
+    _ENSURED.add(parent)
+
+
+def _save_if_changed(prog, path: str) -> bool:
+    """Save *prog* to *path* unless the file already holds the same JSON.
+
+    Leaving an identical file untouched keeps its mtime, so make/watch
+    tools downstream do not rebuild.  Returns True if the file was written.
+    """
+    from cpm.output import write_bytes_if_changed
+
+    if write_bytes_if_changed(path, prog.to_json_bytes()):
+        return True
+    logger.debug("%s unchanged, not rewritten", path)
+    return False
+
+
+# generate steps that --skip-steps may leave out; the dummy programme and
+# the output are always produced
+_SKIPPABLE_STEPS = ("papers", "rooms", "chairs")
+
+
+def _step_list(value: str) -> frozenset[str]:
+    """argparse type for ``--skip-steps``: a comma-separated step list."""
+    steps = frozenset(s.strip() for s in value.split(",") if s.strip())
+    unknown = steps.difference(_SKIPPABLE_STEPS)
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown step(s) {', '.join(sorted(unknown))}; "
+            f"choose from {', '.join(_SKIPPABLE_STEPS)}"
+        )
+    return steps
+
+
+def _up_to_date(out_path: str, input_paths: list[str], variant: str) -> bool:
+    """True if *out_path* is newer than every input and was made by *variant*.
+
+    *variant* (see :func:`_variant_tag`) names the method and options the
+    result was computed with; a result saved without one (e.g. JSON) or
+    with different options is stale.
+    """
+    from cpm.similarity import load_saved_variant
+
+    try:
+        out_mtime = os.stat(out_path).st_mtime_ns
+    except FileNotFoundError:
+        return False
+    if not all(os.stat(p).st_mtime_ns < out_mtime for p in input_paths):
+        return False
+    return load_saved_variant(out_path) == variant
+
+
+def _sbert_variant(args) -> tuple[str, ...]:
+    """The model and encoder options an SBERT result depends on."""
+    return (
+        args.model,
+        os.environ.get("CPM_SBERT_BACKEND", "torch"),
+        "bf16" if args.sbert_bf16 else "fp32",
+        args.score_precision,
+    )
+
+
+def _variant_tag(kind: str, variant: tuple[str, ...]) -> str:
+    """Flatten a result kind and its variant into the string saved with it."""
+    return "|".join((kind, *variant))
+
+
+def _sbert_options(args) -> dict:
+    """Encoding keyword arguments shared by ``similarity`` and ``generate``."""
+    return {
+        "batch_size": args.sbert_batch_size,
+        "precision": args.score_precision,
+        "bf16": args.sbert_bf16,
+        "show_progress_bar": args.progress or None,
+    }
+
+
+def _check_score_precision(args) -> None:
+    """Exit early when ``--score-precision f16`` cannot be honoured."""
+    import importlib.util
+
+    if args.score_precision == "f16" and importlib.util.find_spec("simsimd") is None:
+        print("Error: --score-precision f16 needs the optional simsimd package")
+        sys.exit(1)
+
+
+def _use_tfidf_topic_sim(args, topics) -> bool:
+    """Resolve ``--topic-sim-backend`` for this topic list."""
+    if args.topic_sim_backend == "auto":
+        from cpm.similarity import TFIDF_MAX_TOPICS
+        return len(topics) < TFIDF_MAX_TOPICS
+    return args.topic_sim_backend == "tfidf"
+
+
+def _sbert_cache_key(variant: tuple[str, ...], papers, topics) -> str:
+    """Content hash of everything an SBERT result depends on.
+
+    *variant* holds the model name and encoder options; *papers* may be
+    None for the topic-only matrix.  Ids and texts are hashed in list
+    order, since the topic matrix rows follow the topic order.
+    """
+    import hashlib
+
+    h = hashlib.sha256("\x00".join(variant).encode("utf-8"))
+    for p in papers or ():
+        h.update(f"\x01{p.paper_id}\x00{p.title}".encode("utf-8"))
+    for t in topics:
+        h.update(f"\x02{t.topic_id}\x00{t.name}".encode("utf-8"))
+    return h.hexdigest()
 
 
 # ── sub-command handlers ──────────────────────────────────────────────────
@@ -53,14 +217,12 @@ def cmd_dummy(args):
     cfg = _load_config(args.config)
     prog = generate_dummy_program(cfg)
     _ensure_dir(args.output)
-    prog.save(args.output)
+    _save_if_changed(prog, args.output)
     logger.info("Dummy programme saved to %s", args.output)
 
 
 def cmd_constraints(args):
     """Manage constraints in the schedule config."""
-    from cpm.data_prep import load_constraint_lines
-
     cfg = _load_config(args.config)
 
     if args.action == "list":
@@ -70,9 +232,8 @@ def cmd_constraints(args):
 
     if args.action == "add":
         if args.file:
-            lines = load_constraint_lines(args.file)
-            for line in lines:
-                c = cfg.add_constraint(line)
+            from cpm.data_prep import load_constraint_lines
+            for c in cfg.add_constraints_batch(load_constraint_lines(args.file)):
                 print(f"  Added [{c.cid}]  {c.to_text()}")
         elif args.text:
             c = cfg.add_constraint(args.text)
@@ -112,10 +273,14 @@ def cmd_constraints(args):
 
 def _review_papers_interactive(args, cfg):
     """Interactively review each paper's comment and add constraints."""
-    from cpm.data_prep import load_papers, load_topics
+    from cpm.data_prep import load_topics
+
+    try:
+        import readline  # noqa: F401  (enables line editing and history in input())
+    except ImportError:
+        pass
 
-    mapping = _load_mapping(args.mapping)
-    papers = load_papers(args.papers, mapping)
+    papers = _load_papers(args.papers, args.mapping)
 
     topics = []
     if args.topics:
@@ -131,17 +296,24 @@ def _review_papers_interactive(args, cfg):
     print("For each paper: enter a constraint (e.g. 'paper_42 = day_1'),")
     print("'s' to skip, or 'q' to quit.\n")
 
-    added = 0
+    # Format every preview up front, so the prompt loop only prints
+    pref_labels = {tid: f"{tid} ({name})" for tid, name in tid_to_name.items()}
+    previews = []
     for p in review_papers:
-        pref_str = ", ".join(
-            f"{pid} ({tid_to_name.get(pid, '?')})" for pid in p.pref_ids
-        )
-        print(f"── Paper {p.paper_id}: {p.title}")
-        print(f"   Authors: {', '.join(a.name for a in p.authors)}")
-        print(f"   Prefs:   {pref_str or '(none)'}")
+        pref_str = ", ".join(pref_labels.get(pid) or f"{pid} (?)" for pid in p.pref_ids)
+        lines = [
+            f"── Paper {p.paper_id}: {p.title}",
+            f"   Authors: {', '.join(a.name for a in p.authors)}",
+            f"   Prefs:   {pref_str or '(none)'}",
+        ]
         if p.comment.strip():
-            print(f"   Comment: {p.comment.strip()}")
-        print()
+            lines.append(f"   Comment: {p.comment.strip()}")
+        lines.append("")
+        previews.append("\n".join(lines))
+
+    added = 0
+    for preview in previews:
+        print(preview)
 
         while True:
             try:
@@ -168,7 +340,18 @@ def _review_papers_interactive(args, cfg):
 
 def _capacity_gate(prog, n_papers, cfg, force: bool = False) -> bool:
     """Run capacity pre-flight check. Returns True if we should proceed."""
-    from cpm.assign_papers import check_capacity
+    from cpm.assign_papers import check_capacity, check_capacity_fast
+
+    if force and not sys.stdout.isatty():
+        # Unattended --force run: nobody reads the report, so only check
+        # feasibility and build the full report when there is a deficit.
+        feasible, total_cap, _ = check_capacity_fast(prog, n_papers, cfg)
+        if feasible:
+            logger.debug(
+                "Capacity pre-flight report skipped (--force, non-tty): %d/%d slots",
+                n_papers, total_cap,
+            )
+            return True
 
     report = check_capacity(prog, n_papers, cfg)
     print("\n── Capacity Pre-flight Check ──")
@@ -197,36 +380,39 @@ def _capacity_gate(prog, n_papers, cfg, force: bool = False) -> bool:
 
 def cmd_papers(args):
     """Assign papers to sessions."""
-    from cpm.assign_papers import assign_papers
-    from cpm.data_prep import load_papers, load_topics
-    from cpm.similarity import load_paper_topic_scores, load_topic_similarity_matrix
+    from cpm.data_prep import load_topics
 
     cfg = _load_config(args.config)
-    mapping = _load_mapping(args.mapping)
-    papers = load_papers(args.papers, mapping)
+    papers = _load_papers(args.papers, args.mapping)
     topics = load_topics(args.topics)
     prog = _load_program(args.program)
 
     if not _capacity_gate(prog, len(papers), cfg, force=args.force):
         return
 
+    # Heavy modules (numpy, OR-Tools) are imported only past the gate
     sbert_scores = None
     if args.sbert_scores:
+        from cpm.similarity import load_paper_topic_scores
         sbert_scores = load_paper_topic_scores(args.sbert_scores)
 
     topic_sim = None
     if args.topic_sim:
+        from cpm.similarity import load_topic_similarity_matrix
         _, _, topic_sim = load_topic_similarity_matrix(args.topic_sim)
 
+    from cpm.assign_papers import assign_papers
     prog = assign_papers(
         prog, papers, topics, cfg,
         sbert_scores=sbert_scores,
         topic_sim_matrix=topic_sim,
         merge_threshold=args.merge_threshold,
         min_group_size=args.min_group_size,
+        num_workers=args.workers,
+        preset=args.cp_preset,
     )
     _ensure_dir(args.output)
-    prog.save(args.output)
+    _save_if_changed(prog, args.output)
     logger.info("Papers assigned → %s", args.output)
 
     # Write unassigned papers
@@ -242,7 +428,7 @@ def cmd_papers(args):
 def cmd_rooms(args):
     """Assign rooms to sessions."""
     from cpm.assign_rooms import assign_rooms
-    from cpm.data_prep import generate_default_rooms, load_papers, load_rooms
+    from cpm.data_prep import generate_default_rooms, load_rooms
 
     cfg = _load_config(args.config)
     prog = _load_program(args.program)
@@ -255,19 +441,18 @@ def cmd_rooms(args):
     # Load papers for topic-popularity-based room sizing (optional)
     papers = None
     if getattr(args, "papers", None) and getattr(args, "mapping", None):
-        mapping = _load_mapping(args.mapping)
-        papers = load_papers(args.papers, mapping)
+        papers = _load_papers(args.papers, args.mapping)
 
     prog = assign_rooms(prog, rooms, cfg, papers=papers)
     _ensure_dir(args.output)
-    prog.save(args.output)
+    _save_if_changed(prog, args.output)
     logger.info("Rooms assigned → %s", args.output)
 
 
 def cmd_chairs(args):
     """Assign chairs to sessions."""
     from cpm.assign_chairs import assign_chairs
-    from cpm.data_prep import generate_default_chairs, load_chairs, load_papers
+    from cpm.data_prep import generate_default_chairs, load_chairs
 
     cfg = _load_config(args.config)
     prog = _load_program(args.program)
@@ -280,12 +465,11 @@ def cmd_chairs(args):
     # Load papers for topic inference and presenter detection (optional)
     papers = None
     if getattr(args, "papers", None) and getattr(args, "mapping", None):
-        mapping = _load_mapping(args.mapping)
-        papers = load_papers(args.papers, mapping)
+        papers = _load_papers(args.papers, args.mapping)
 
     prog = assign_chairs(prog, chairs, cfg, papers=papers)
     _ensure_dir(args.output)
-    prog.save(args.output)
+    _save_if_changed(prog, args.output)
     logger.info("Chairs assigned → %s", args.output)
 
 
@@ -382,9 +566,7 @@ def cmd_edit(args):
         # Try to load full paper data from CSV if provided
         paper_obj = None
         if args.papers and args.mapping:
-            mapping = _load_mapping(args.mapping)
-            from cpm.data_prep import load_papers
-            all_papers = load_papers(args.papers, mapping)
+            all_papers = _load_papers(args.papers, args.mapping)
             for p in all_papers:
                 if p.paper_id == args.paper_id:
                     paper_obj = p
@@ -475,11 +657,11 @@ def cmd_edit(args):
             replace_chair(prog, args.a, new_ch)
         elif args.chairs:
             # Load external chairs file and suggest
-            from cpm.data_prep import load_chairs, load_papers
+            from cpm.data_prep import load_chairs
             all_chairs = load_chairs(args.chairs)
             papers = None
             if getattr(args, "papers", None) and getattr(args, "mapping", None):
-                papers = load_papers(args.papers, _load_mapping(args.mapping))
+                papers = _load_papers(args.papers, args.mapping)
             suggestions = suggest_chairs(prog, args.a, all_chairs,
                                          papers=papers, top_n=10)
             if not suggestions:
@@ -507,11 +689,11 @@ def cmd_edit(args):
         if not args.chairs:
             print("Error: --chairs CSV is required for suggest-chairs")
             sys.exit(1)
-        from cpm.data_prep import load_chairs, load_papers
+        from cpm.data_prep import load_chairs
         all_chairs = load_chairs(args.chairs)
         papers = None
         if getattr(args, "papers", None) and getattr(args, "mapping", None):
-            papers = load_papers(args.papers, _load_mapping(args.mapping))
+            papers = _load_papers(args.papers, args.mapping)
         suggestions = suggest_chairs(prog, args.a, all_chairs,
                                      papers=papers, top_n=10)
         if not suggestions:
@@ -530,19 +712,17 @@ def cmd_edit(args):
     # Save modified programme
     out = args.output or args.program
     _ensure_dir(out)
-    prog.save(out)
+    _save_if_changed(prog, out)
     logger.info("Edited programme saved to %s", out)
 
 
 def cmd_output(args):
     """Render the programme to Markdown, LaTeX, LaTeX folder, mobile HTML, or CMS CSV."""
-    from cpm.output import write_cms_csvs, write_program
-    from cpm.output_latex import generate_latex_folder
-    from cpm.output_mobile import generate_mobile_html
-
     prog = _load_program(args.program)
 
+    # Import only the renderer for the requested format
     if args.format == "latex-folder":
+        from cpm.output_latex import generate_latex_folder
         latex_cfg = args.latex_config or None
         out_dir = args.output or "output/latex"
         abs_tpl = getattr(args, "with_abstracts", None) or None
@@ -552,12 +732,14 @@ def cmd_output(args):
         )
         logger.info("LaTeX folder written to %s", out_dir)
     elif args.format == "mobile":
+        from cpm.output_mobile import generate_mobile_html
         latex_cfg = args.latex_config or None
         out_file = args.output or "output/programme.html"
         _ensure_dir(out_file)
         generate_mobile_html(prog, out_file, latex_config=latex_cfg)
         logger.info("Mobile HTML written to %s", out_file)
     elif args.format == "cms-csv":
+        from cpm.output import write_cms_csvs
         sess_out = args.cms_sessions or "output/cms_sessions.csv"
         pres_out = args.cms_presentations or "output/cms_presentations.csv"
         _ensure_dir(sess_out)
@@ -566,6 +748,7 @@ def cmd_output(args):
         write_cms_csvs(prog, sess_out, pres_out, presentation_duration=dur)
         logger.info("CMS CSVs written to %s, %s", sess_out, pres_out)
     else:
+        from cpm.output import write_program
         _ensure_dir(args.output)
         write_program(prog, args.output, fmt=args.format)
         logger.info("Programme written to %s (%s)", args.output, args.format)
@@ -573,7 +756,7 @@ def cmd_output(args):
 
 def cmd_similarity(args):
     """Compute SBERT similarity scores."""
-    from cpm.data_prep import load_papers, load_topics
+    from cpm.data_prep import load_topics
     from cpm.similarity import (
         compute_paper_topic_scores,
         compute_topic_similarity_matrix,
@@ -581,52 +764,67 @@ def cmd_similarity(args):
         save_topic_similarity_matrix,
     )
 
-    mapping = _load_mapping(args.mapping)
-    papers = load_papers(args.papers, mapping)
+    pt_out = args.paper_topic_output or "output/paper_topic_scores.npz"
+    tt_out = args.topic_topic_output or "output/topic_similarity_matrix.npz"
+    do_pt = args.paper_topic or args.all
+    do_tt = args.topic_topic or args.all
+    _check_score_precision(args)
+
     topics = load_topics(args.topics)
+    use_tfidf = _use_tfidf_topic_sim(args, topics)
+    pt_variant = _variant_tag("paper-topic", _sbert_variant(args))
+    tt_variant = _variant_tag(
+        "topic-topic", ("tfidf",) if use_tfidf else ("sbert", *_sbert_variant(args)),
+    )
+    if not args.force:
+        if do_pt and _up_to_date(pt_out, [args.papers, args.topics, args.mapping], pt_variant):
+            logger.info("Up to date: %s", pt_out)
+            do_pt = False
+        if do_tt and _up_to_date(tt_out, [args.topics], tt_variant):
+            logger.info("Up to date: %s", tt_out)
+            do_tt = False
+        if not (do_pt or do_tt):
+            return
 
-    if args.paper_topic or args.all:
-        out = args.paper_topic_output or "output/paper_topic_scores.json"
+    papers = _load_papers(args.papers, args.mapping)
+
+    if do_pt:
+        out = pt_out
         _ensure_dir(out)
-        scores = compute_paper_topic_scores(papers, topics, model_name=args.model)
-        save_paper_topic_scores(scores, out)
+        scores = compute_paper_topic_scores(
+            papers, topics, model_name=args.model, cache_dir=args.sbert_cache or None,
+            **_sbert_options(args),
+        )
+        save_paper_topic_scores(scores, out, variant=pt_variant)
         logger.info("Paper–topic scores saved to %s", out)
 
-    if args.topic_topic or args.all:
-        out = args.topic_topic_output or "output/topic_similarity_matrix.json"
+    if do_tt:
+        out = tt_out
         _ensure_dir(out)
-        matrix = compute_topic_similarity_matrix(topics, model_name=args.model)
-        save_topic_similarity_matrix(matrix, topics, out)
+        if use_tfidf:
+            from cpm.similarity import compute_topic_similarity_tfidf
+            matrix = compute_topic_similarity_tfidf(topics)
+        else:
+            matrix = compute_topic_similarity_matrix(
+                topics, model_name=args.model, cache_dir=args.sbert_cache or None,
+                **_sbert_options(args),
+            )
+        save_topic_similarity_matrix(matrix, topics, out, variant=tt_variant)
         logger.info("Topic–topic similarity saved to %s", out)
 
 
 def cmd_generate(args):
-    """Full pipeline: dummy → papers → rooms → chairs → output."""
-    from cpm.assign_chairs import assign_chairs
-    from cpm.assign_papers import assign_papers
-    from cpm.assign_rooms import assign_rooms
-    from cpm.data_prep import (
-        generate_default_chairs,
-        generate_default_rooms,
-        load_chairs,
-        load_papers,
-        load_rooms,
-        load_topics,
-    )
+    """Full pipeline: dummy → papers → rooms → chairs → output.
+
+    Each step imports only the modules it needs, so e.g. a run without
+    ``--use-sbert`` never loads the similarity code, and steps named in
+    ``--skip-steps`` never load theirs.
+    """
+    from cpm.data_prep import load_topics
     from cpm.dummy_program import generate_dummy_program
-    from cpm.output import write_program
-    from cpm.similarity import (
-        compute_paper_topic_scores,
-        compute_topic_similarity_matrix,
-        load_paper_topic_scores,
-        load_topic_similarity_matrix,
-        save_paper_topic_scores,
-        save_topic_similarity_matrix,
-    )
 
     cfg = _load_config(args.config)
-    mapping = _load_mapping(args.mapping)
-    papers = load_papers(args.papers, mapping)
+    papers = _load_papers(args.papers, args.mapping)
     topics = load_topics(args.topics)
 
     # Copy day_names from latex config if schedule config doesn't have them
@@ -641,77 +839,160 @@ def cmd_generate(args):
     logger.info("Step 1/6: generating dummy programme …")
     prog = generate_dummy_program(cfg)
 
+    skip = args.skip_steps
+
     # Step 2 – SBERT scores (optional)
     sbert_scores = None
     topic_sim = None
-    if args.use_sbert:
+    if "papers" in skip:
+        logger.info("Step 2/6: skipping SBERT (papers step skipped)")
+    elif args.use_sbert:
+        _check_score_precision(args)
         logger.info("Step 2/6: computing SBERT scores …")
-        sbert_out = args.sbert_scores or "output/paper_topic_scores.json"
-        topic_sim_out = args.topic_sim or "output/topic_similarity_matrix.json"
+        sbert_out = args.sbert_scores or "output/paper_topic_scores.npz"
+        topic_sim_out = args.topic_sim or "output/topic_similarity_matrix.npz"
         _ensure_dir(sbert_out)
         _ensure_dir(topic_sim_out)
 
-        if Path(sbert_out).exists():
-            sbert_scores = load_paper_topic_scores(sbert_out)
-        else:
-            sbert_scores = compute_paper_topic_scores(
-                papers, topics, model_name=args.model,
+        # Explicitly given files are used as-is; otherwise results are
+        # cached by a hash of their inputs, so edited papers/topics are
+        # never served stale scores.
+        score_cache = Path(sbert_out).parent / ".sbert_cache"
+        variant = _sbert_variant(args)
+
+        def paper_scores():
+            if args.sbert_scores and Path(sbert_out).exists():
+                from cpm.similarity import load_paper_topic_scores
+                return load_paper_topic_scores(sbert_out)
+            from cpm.similarity import load_paper_topic_scores, save_paper_topic_scores
+            cached = score_cache / f"scores-{_sbert_cache_key(variant, papers, topics)}.npz"
+            if cached.exists():
+                scores = load_paper_topic_scores(cached)
+                logger.info("Paper–topic scores unchanged (cache hit)")
+            else:
+                from cpm.similarity import compute_paper_topic_scores
+                scores = compute_paper_topic_scores(
+                    papers, topics, model_name=args.model,
+                    cache_dir=args.sbert_cache or None,
+                    **_sbert_options(args),
+                )
+                score_cache.mkdir(parents=True, exist_ok=True)
+                save_paper_topic_scores(scores, cached)
+            save_paper_topic_scores(
+                scores, sbert_out, variant=_variant_tag("paper-topic", variant),
             )
-            save_paper_topic_scores(sbert_scores, sbert_out)
-
-        if Path(topic_sim_out).exists():
-            _, _, topic_sim = load_topic_similarity_matrix(topic_sim_out)
-        else:
-            topic_sim = compute_topic_similarity_matrix(
-                topics, model_name=args.model,
+            return scores
+
+        def topic_matrix():
+            if args.topic_sim and Path(topic_sim_out).exists():
+                from cpm.similarity import load_topic_similarity_matrix
+                return load_topic_similarity_matrix(topic_sim_out)[2]
+            from cpm.similarity import (
+                load_topic_similarity_matrix,
+                save_topic_similarity_matrix,
             )
-            save_topic_similarity_matrix(topic_sim, topics, topic_sim_out)
+            if _use_tfidf_topic_sim(args, topics):
+                # Model-free and instant: not worth caching
+                from cpm.similarity import compute_topic_similarity_tfidf
+                matrix = compute_topic_similarity_tfidf(topics)
+                save_topic_similarity_matrix(
+                    matrix, topics, topic_sim_out,
+                    variant=_variant_tag("topic-topic", ("tfidf",)),
+                )
+                return matrix
+            cached = score_cache / f"topics-{_sbert_cache_key(variant, None, topics)}.npz"
+            if cached.exists():
+                matrix = load_topic_similarity_matrix(cached)[2]
+                logger.info("Topic–topic similarity unchanged (cache hit)")
+            else:
+                from cpm.similarity import compute_topic_similarity_matrix
+                matrix = compute_topic_similarity_matrix(
+                    topics, model_name=args.model,
+                    cache_dir=args.sbert_cache or None,
+                    **_sbert_options(args),
+                )
+                score_cache.mkdir(parents=True, exist_ok=True)
+                save_topic_similarity_matrix(matrix, topics, cached)
+            save_topic_similarity_matrix(
+                matrix, topics, topic_sim_out,
+                variant=_variant_tag("topic-topic", ("sbert", *variant)),
+            )
+            return matrix
+
+        # The two results are independent.  Encoding itself is serialised
+        # (one shared model, see similarity._ENCODE_LOCK), so --jobs 2 only
+        # overlaps one side's encode with the other's cache I/O and scoring
+        if args.jobs > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                scores_job = pool.submit(paper_scores)
+                matrix_job = pool.submit(topic_matrix)
+                sbert_scores, topic_sim = scores_job.result(), matrix_job.result()
+        else:
+            sbert_scores, topic_sim = paper_scores(), topic_matrix()
     else:
         logger.info("Step 2/6: skipping SBERT (--use-sbert not set)")
 
     # Step 3 – capacity check + assign papers
-    if not _capacity_gate(prog, len(papers), cfg, force=args.force):
-        return
+    if "papers" in skip:
+        logger.info("Step 3/6: skipping paper assignment (--skip-steps)")
+    else:
+        if not _capacity_gate(prog, len(papers), cfg, force=args.force):
+            return
 
-    logger.info("Step 3/6: assigning papers …")
-    prog = assign_papers(
-        prog, papers, topics, cfg,
-        sbert_scores=sbert_scores,
-        topic_sim_matrix=topic_sim,
-    )
+        logger.info("Step 3/6: assigning papers …")
+        from cpm.assign_papers import assign_papers
+        prog = assign_papers(
+            prog, papers, topics, cfg,
+            sbert_scores=sbert_scores,
+            topic_sim_matrix=topic_sim,
+            num_workers=args.workers,
+            preset=args.cp_preset,
+        )
 
-    # Write unassigned papers
-    from cpm.output import write_unassigned_papers
-    ua_path = str(Path(args.output or "output/program.json").parent / "unassigned_papers.csv")
-    unassigned = write_unassigned_papers(prog, papers, ua_path)
-    if unassigned:
-        logger.info("%d unassigned papers → %s", len(unassigned), ua_path)
-    else:
-        logger.info("All %d papers assigned.", len(papers))
+        # Write unassigned papers
+        from cpm.output import write_unassigned_papers
+        ua_path = str(Path(args.output or "output/program.json").parent / "unassigned_papers.csv")
+        unassigned = write_unassigned_papers(prog, papers, ua_path)
+        if unassigned:
+            logger.info("%d unassigned papers → %s", len(unassigned), ua_path)
+        else:
+            logger.info("All %d papers assigned.", len(papers))
 
     # Step 4 – assign rooms
-    logger.info("Step 4/6: assigning rooms …")
-    if args.rooms and Path(args.rooms).exists():
-        rooms = load_rooms(args.rooms)
+    if "rooms" in skip:
+        logger.info("Step 4/6: skipping room assignment (--skip-steps)")
     else:
-        rooms = generate_default_rooms(cfg.num_available_rooms)
-    prog = assign_rooms(prog, rooms, cfg, papers=papers)
+        logger.info("Step 4/6: assigning rooms …")
+        from cpm.assign_rooms import assign_rooms
+        from cpm.data_prep import generate_default_rooms, load_rooms
+        if args.rooms and Path(args.rooms).exists():
+            rooms = load_rooms(args.rooms)
+        else:
+            rooms = generate_default_rooms(cfg.num_available_rooms)
+        prog = assign_rooms(prog, rooms, cfg, papers=papers)
 
     # Step 5 – assign chairs
-    logger.info("Step 5/6: assigning chairs …")
-    if args.chairs and Path(args.chairs).exists():
-        chairs = load_chairs(args.chairs)
+    if "chairs" in skip:
+        logger.info("Step 5/6: skipping chair assignment (--skip-steps)")
     else:
-        chairs = generate_default_chairs(args.num_chairs)
-    prog = assign_chairs(prog, chairs, cfg, papers=papers)
+        logger.info("Step 5/6: assigning chairs …")
+        from cpm.assign_chairs import assign_chairs
+        from cpm.data_prep import generate_default_chairs, load_chairs
+        if args.chairs and Path(args.chairs).exists():
+            chairs = load_chairs(args.chairs)
+        else:
+            chairs = generate_default_chairs(args.num_chairs)
+        prog = assign_chairs(prog, chairs, cfg, papers=papers)
 
     # Step 6 – output
     logger.info("Step 6/6: writing output …")
     prog_out = args.output or "output/program.json"
     _ensure_dir(prog_out)
-    prog.save(prog_out)
 
     fmt = args.format or "md"
+    if fmt in ("latex-folder", "mobile", "cms-csv"):
+        _save_if_changed(prog, prog_out)
 
     if fmt == "latex-folder":
         from cpm.output_latex import generate_latex_folder
@@ -739,27 +1020,22 @@ def cmd_generate(args):
         write_cms_csvs(prog, sess_out, pres_out, presentation_duration=dur)
         logger.info("Done. Programme → %s, CMS CSVs → %s, %s", prog_out, sess_out, pres_out)
     else:
+        from cpm.output import save_and_render
         render_out = str(Path(prog_out).with_suffix(f".{fmt}"))
-        write_program(prog, render_out, fmt=fmt)
+        save_and_render(prog, prog_out, render_out, fmt=fmt)
         logger.info("Done. Programme → %s, Rendered → %s", prog_out, render_out)
 
 
 # ── argument parser ──────────────────────────────────────────────────────
 
-def build_parser() -> argparse.ArgumentParser:
-    p = argparse.ArgumentParser(
-        prog="cpm",
-        description="Conference Programme Manager",
-    )
-    sub = p.add_subparsers(dest="command", required=True)
-
-    # ---- dummy ----
+def _add_dummy_parser(sub) -> None:
     sp = sub.add_parser("dummy", help="Generate a skeleton programme")
     sp.add_argument("--config", required=True, help="Schedule config JSON")
     sp.add_argument("--output", default="output/dummy_program.json")
     sp.set_defaults(func=cmd_dummy)
 
-    # ---- constraints ----
+
+def _add_constraints_parser(sub) -> None:
     sp = sub.add_parser("constraints", help="Manage constraints")
     sp.add_argument("--config", required=True, help="Schedule config JSON")
     sp.add_argument("action", choices=["list", "add", "edit", "delete", "review"])
@@ -771,7 +1047,8 @@ def build_parser() -> argparse.ArgumentParser:
     sp.add_argument("--topics", help="Topics CSV (for review, optional)")
     sp.set_defaults(func=cmd_constraints)
 
-    # ---- papers ----
+
+def _add_papers_parser(sub) -> None:
     sp = sub.add_parser("papers", help="Assign papers to sessions")
     sp.add_argument("--config", required=True)
     sp.add_argument("--mapping", required=True, help="Column-mapping JSON")
@@ -779,15 +1056,21 @@ def build_parser() -> argparse.ArgumentParser:
     sp.add_argument("--topics", required=True, help="Topics CSV")
     sp.add_argument("--program", required=True, help="Input programme JSON (dummy)")
     sp.add_argument("--output", default="output/program_papers.json")
-    sp.add_argument("--sbert-scores", help="Pre-computed SBERT scores JSON")
-    sp.add_argument("--topic-sim", help="Pre-computed topic similarity JSON")
+    sp.add_argument("--sbert-scores", help="Pre-computed SBERT scores (.npz or JSON)")
+    sp.add_argument("--topic-sim", help="Pre-computed topic similarity (.npz or JSON)")
     sp.add_argument("--merge-threshold", type=float, default=0.75)
     sp.add_argument("--min-group-size", type=int, default=3)
+    sp.add_argument("--workers", type=int, default=8,
+                    help="CP-SAT search workers (0 = all cores; default: 8)")
+    sp.add_argument("--cp-preset", choices=["fast", "balanced", "quality"],
+                    default="balanced",
+                    help="CP-SAT parameter preset (default: balanced)")
     sp.add_argument("--force", action="store_true",
                     help="Proceed even if capacity is insufficient")
     sp.set_defaults(func=cmd_papers)
 
-    # ---- rooms ----
+
+def _add_rooms_parser(sub) -> None:
     sp = sub.add_parser("rooms", help="Assign rooms to sessions")
     sp.add_argument("--config", required=True)
     sp.add_argument("--program", required=True, help="Input programme JSON")
@@ -797,7 +1080,8 @@ def build_parser() -> argparse.ArgumentParser:
     sp.add_argument("--output", default="output/program_rooms.json")
     sp.set_defaults(func=cmd_rooms)
 
-    # ---- chairs ----
+
+def _add_chairs_parser(sub) -> None:
     sp = sub.add_parser("chairs", help="Assign chairs to sessions")
     sp.add_argument("--config", required=True)
     sp.add_argument("--program", required=True, help="Input programme JSON")
@@ -808,7 +1092,8 @@ def build_parser() -> argparse.ArgumentParser:
     sp.add_argument("--output", default="output/program_chairs.json")
     sp.set_defaults(func=cmd_chairs)
 
-    # ---- edit ----
+
+def _add_edit_parser(sub) -> None:
     sp = sub.add_parser("edit", help="Manual post-output programme edits")
     sp.add_argument("action",
                     choices=["list", "list-slots", "swap", "move", "move-slot",
@@ -851,7 +1136,8 @@ def build_parser() -> argparse.ArgumentParser:
                     help="Output JSON (default: overwrite input)")
     sp.set_defaults(func=cmd_edit)
 
-    # ---- output ----
+
+def _add_output_parser(sub) -> None:
     sp = sub.add_parser("output", help="Render programme to md/latex/latex-folder/mobile/cms-csv")
     sp.add_argument("--program", required=True)
     sp.add_argument("--format", choices=["md", "latex", "latex-folder", "mobile", "cms-csv"],
@@ -867,7 +1153,8 @@ def build_parser() -> argparse.ArgumentParser:
                     help="PDF path template for abstracts, e.g. 'pdf/conf_<id>.pdf' (latex-folder)")
     sp.set_defaults(func=cmd_output)
 
-    # ---- similarity ----
+
+def _add_similarity_parser(sub) -> None:
     sp = sub.add_parser("similarity", help="Compute SBERT similarity scores")
     sp.add_argument("--mapping", required=True)
     sp.add_argument("--papers", required=True)
@@ -876,11 +1163,28 @@ def build_parser() -> argparse.ArgumentParser:
     sp.add_argument("--paper-topic", action="store_true")
     sp.add_argument("--topic-topic", action="store_true")
     sp.add_argument("--all", action="store_true")
-    sp.add_argument("--paper-topic-output", default="output/paper_topic_scores.json")
-    sp.add_argument("--topic-topic-output", default="output/topic_similarity_matrix.json")
+    sp.add_argument("--paper-topic-output", default="output/paper_topic_scores.npz")
+    sp.add_argument("--topic-topic-output", default="output/topic_similarity_matrix.npz")
+    sp.add_argument("--sbert-cache", default=".cache/sbert",
+                    help="Embedding cache directory ('' disables; default: .cache/sbert)")
+    sp.add_argument("--sbert-bf16", action="store_true",
+                    help="Encode under bfloat16 autocast (faster on BF16/AMX CPUs)")
+    sp.add_argument("--sbert-batch-size", type=int, default=64,
+                    help="Sentences per encoder batch (default: 64)")
+    sp.add_argument("--score-precision", choices=["f32", "f16"], default="f32",
+                    help="Width of the cosine product over finished embeddings; f16 "
+                         "needs simsimd and does not speed up encoding (default: f32)")
+    sp.add_argument("--progress", action="store_true",
+                    help="Show a progress bar while encoding")
+    sp.add_argument("--topic-sim-backend", choices=["sbert", "tfidf", "auto"], default="sbert",
+                    help="Topic-topic similarity method; 'auto' uses TF-IDF below 30 topics "
+                         "(default: sbert)")
+    sp.add_argument("--force", action="store_true",
+                    help="Recompute even if the outputs are newer than all inputs")
     sp.set_defaults(func=cmd_similarity)
 
-    # ---- generate (full pipeline) ----
+
+def _add_generate_parser(sub) -> None:
     sp = sub.add_parser("generate", help="Full pipeline")
     sp.add_argument("--config", required=True)
     sp.add_argument("--mapping", required=True)
@@ -895,24 +1199,82 @@ def build_parser() -> argparse.ArgumentParser:
     sp.add_argument("--latex-config", help="LaTeX config JSON (for latex-folder/mobile)")
     sp.add_argument("--use-sbert", action="store_true")
     sp.add_argument("--model", default="all-MiniLM-L6-v2")
-    sp.add_argument("--sbert-scores", help="Pre-computed SBERT scores JSON")
-    sp.add_argument("--topic-sim", help="Pre-computed topic similarity JSON")
+    sp.add_argument("--sbert-scores", help="Pre-computed SBERT scores (.npz or JSON)")
+    sp.add_argument("--topic-sim", help="Pre-computed topic similarity (.npz or JSON)")
+    sp.add_argument("--sbert-cache", default=".cache/sbert",
+                    help="Embedding cache directory ('' disables; default: .cache/sbert)")
+    sp.add_argument("--sbert-bf16", action="store_true",
+                    help="Encode under bfloat16 autocast (faster on BF16/AMX CPUs)")
+    sp.add_argument("--sbert-batch-size", type=int, default=64,
+                    help="Sentences per encoder batch (default: 64)")
+    sp.add_argument("--score-precision", choices=["f32", "f16"], default="f32",
+                    help="Width of the cosine product over finished embeddings; f16 "
+                         "needs simsimd and does not speed up encoding (default: f32)")
+    sp.add_argument("--progress", action="store_true",
+                    help="Show a progress bar while encoding")
+    sp.add_argument("--topic-sim-backend", choices=["sbert", "tfidf", "auto"], default="sbert",
+                    help="Topic-topic similarity method; 'auto' uses TF-IDF below 30 topics "
+                         "(default: sbert)")
+    sp.add_argument("--jobs", type=int, default=1,
+                    help="Compute the two SBERT results on two threads when > 1; "
+                         "encoding stays serialised (default: 1)")
+    sp.add_argument("--workers", type=int, default=8,
+                    help="CP-SAT search workers (0 = all cores; default: 8)")
+    sp.add_argument("--cp-preset", choices=["fast", "balanced", "quality"],
+                    default="balanced",
+                    help="CP-SAT parameter preset (default: balanced)")
     sp.add_argument("--force", action="store_true",
                     help="Proceed even if capacity is insufficient")
     sp.add_argument("--with-abstracts", default=None,
                     help="PDF path template for abstracts, e.g. 'pdf/conf_<id>.pdf' (latex-folder)")
+    sp.add_argument("--skip-steps", type=_step_list, default=frozenset(),
+                    help="Comma-separated steps to leave out: papers, rooms, chairs")
     sp.set_defaults(func=cmd_generate)
 
+
+# Subcommand name -> function adding its parser to the subparsers action.
+# main() builds only the one being run; help and unknown names get all.
+_SUBCOMMANDS = {
+    "dummy": _add_dummy_parser,
+    "constraints": _add_constraints_parser,
+    "papers": _add_papers_parser,
+    "rooms": _add_rooms_parser,
+    "chairs": _add_chairs_parser,
+    "edit": _add_edit_parser,
+    "output": _add_output_parser,
+    "similarity": _add_similarity_parser,
+    "generate": _add_generate_parser,
+}
+
+
+def build_parser(only: str | None = None) -> argparse.ArgumentParser:
+    """Build the ``cpm`` parser, with just the *only* subcommand if given."""
+    p = argparse.ArgumentParser(
+        prog="cpm",
+        description="Conference Programme Manager",
+    )
+    sub = p.add_subparsers(dest="command", required=True)
+    if only is not None:
+        _SUBCOMMANDS[only](sub)
+    else:
+        for add_parser in _SUBCOMMANDS.values():
+            add_parser(sub)
     return p
 
 
-def main():
+def main(argv: list[str] | None = None):
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     )
-    parser = build_parser()
-    args = parser.parse_args()
+    # Directories may have been removed since a previous main() call
+    _ENSURED.clear()
+    if argv is None:
+        argv = sys.argv[1:]
+    # Only the invoked subcommand's arguments need to be set up
+    only = argv[0] if argv and argv[0] in _SUBCOMMANDS else None
+    parser = build_parser(only)
+    args = parser.parse_args(argv)
     args.func(args)
 
 
@@ -198,6 +198,20 @@ class ScheduleConfig:
         self.constraints.append(c)
         return c
 
+    def add_constraints_batch(self, texts: list[str]) -> list[Constraint]:
+        """Parse all of *texts*, then append them in one go.
+
+        If any line fails to parse, the ValueError propagates and no
+        constraint is added.
+        """
+        base = len(self.constraints)
+        new = [
+            Constraint.from_text(text, cid=f"C{base + i + 1:03d}")
+            for i, text in enumerate(texts)
+        ]
+        self.constraints.extend(new)
+        return new
+
     def remove_constraint(self, cid: str) -> bool:
         before = len(self.constraints)
         self.constraints = [c for c in self.constraints if c.cid != cid]
@@ -8,10 +8,11 @@ import re
 from pathlib import Path
 from typing import Any
 
-import pandas as pd
-
 from .models import Author, Chair, ColumnMapping, Paper, Room, Topic
 
+# pandas is imported inside the CSV loaders, so commands that never read a
+# CSV (dummy, output, constraints list, ...) start without it.
+
 logger = logging.getLogger(__name__)
 
 
@@ -140,6 +141,8 @@ def _resolve_all(mapping: ColumnMapping, columns: list[str]) -> dict[str, list[s
 
 def load_papers(csv_path: str | Path, mapping: ColumnMapping) -> list[Paper]:
     """Load papers from a CSV file using the given column mapping."""
+    import pandas as pd
+
     enc = _detect_encoding(csv_path, mapping.encoding)
     df = pd.read_csv(
         csv_path,
@@ -224,6 +227,8 @@ def load_topics(
     sep: str = ";",
 ) -> list[Topic]:
     """Load topics from a CSV file."""
+    import pandas as pd
+
     df = pd.read_csv(csv_path, sep=sep, dtype=str, keep_default_na=False)
     df.columns = [c.strip() for c in df.columns]
     topics: list[Topic] = []
@@ -248,6 +253,8 @@ def load_rooms(
     capacity_col: str = "capacity",
     sep: str = ";",
 ) -> list[Room]:
+    import pandas as pd
+
     enc = _detect_encoding(csv_path, "utf-8")
     df = pd.read_csv(csv_path, sep=sep, dtype=str, keep_default_na=False,
                       encoding=enc)
@@ -288,6 +295,8 @@ def load_chairs(
       - Simple: ``chair_id;chair_name``
       - Extended: ``chair_id;lastname;firstname;email;position;arrival;departure``
     """
+    import pandas as pd
+
     enc = _detect_encoding(csv_path, "utf-8")
     df = pd.read_csv(csv_path, sep=sep, dtype=str, keep_default_na=False,
                       encoding=enc)
@@ -7,7 +7,10 @@ Session IDs are generated so they can be referenced in subsequent constraints.
 
 from __future__ import annotations
 
-from .config import ScheduleConfig
+import heapq
+from operator import itemgetter
+
+from .config import PlenarySlot, ScheduleConfig
 from .models import (
     DayProgram,
     Program,
@@ -45,33 +48,61 @@ def _parse_break_overrides(cfg: ScheduleConfig) -> dict[str, dict[int, int]]:
     return overrides
 
 
+def _plenaries_by_day(
+    cfg: ScheduleConfig,
+) -> dict[int, list[tuple[int, int, PlenarySlot]]]:
+    """Group plenary slots by day as ``(start_min, end_min, slot)`` tuples.
+
+    Times are parsed once per slot and each day's list is sorted by start.
+    """
+    by_day: dict[int, list[tuple[int, int, PlenarySlot]]] = {}
+    for ps in cfg.plenary_slots:
+        by_day.setdefault(ps.day, []).append((_minutes(ps.start), _minutes(ps.end), ps))
+    for prelims in by_day.values():
+        prelims.sort(key=itemgetter(0))
+    return by_day
+
+
+def _fixed_labels(cfg: ScheduleConfig) -> dict[str, str]:
+    """Collect constraints that fix a session label (``section_X = "..."``)."""
+    fixed_labels: dict[str, str] = {}
+    for c in cfg.constraints:
+        if c.subject_type == "section" and c.op.value == "=" and c.value:
+            fixed_labels[c.subject_id] = c.value[0]
+    return fixed_labels
+
+
 def _build_day_slots(
     cfg: ScheduleConfig,
     day: int,
     session_counter: list[int],
+    *,
+    prelims: list[tuple[int, int, PlenarySlot]] | None = None,
+    fixed_labels: dict[str, str] | None = None,
+    break_overrides: dict[str, dict[int, int]] | None = None,
 ) -> list[dict]:
     """Build the list of time-slot dicts for one day.
 
+    *prelims*, *fixed_labels* and *break_overrides* may be precomputed by
+    the caller (see :func:`generate_dummy_program`); they are derived from
+    *cfg* when omitted.
+
     Returns a list of slot dicts:
       {"time_slot": TimeSlot, "sessions": [Session, ...]}
     """
     start = _minutes(cfg.effective_day_start(day))
     end = _minutes(cfg.effective_day_end(day))
 
-    # Collect plenary slots for this day, sorted by start time
-    prelims = sorted(
-        [ps for ps in cfg.plenary_slots if ps.day == day],
-        key=lambda ps: _minutes(ps.start),
-    )
+    # Plenary slots for this day, sorted by start time
+    if prelims is None:
+        prelims = _plenaries_by_day(cfg).get(day, [])
 
-    # Collect constraints that fix a session label
-    fixed_labels: dict[str, str] = {}
-    for c in cfg.constraints:
-        if c.subject_type == "section" and c.op.value == "=" and c.value:
-            fixed_labels[c.subject_id] = c.value[0]
+    if fixed_labels is None:
+        fixed_labels = _fixed_labels(cfg)
 
     # Per-day break/lunch/dinner time overrides
-    break_overrides = _parse_break_overrides(cfg)
+    if break_overrides is None:
+        break_overrides = _parse_break_overrides(cfg)
 
     slots: list[dict] = []
     cursor = start
@@ -80,9 +111,7 @@ def _build_day_slots(
     # Place breaks and lunch at configurable target times.
     # Find when regular sessions actually begin (after contiguous opening plenaries).
     eff_start = start
-    for ps in prelims:
-        ps_start = _minutes(ps.start)
-        ps_end = _minutes(ps.end)
+    for ps_start, ps_end, _ps in prelims:
         # Only count prelims that start within room_change_penalty of current eff_start
         if ps_start <= eff_start + cfg.room_change_penalty_min:
             eff_start = ps_end
@@ -105,7 +134,6 @@ def _build_day_slots(
 
     # If effective start is already past the morning break target, skip it
     can_morning = cfg.morning_break and eff_start < mb_target
-    morning_break_target = mb_target if can_morning else end + 1
     # Explicit per-day overrides bypass the eff_start guard
     if has_explicit_lunch:
         lunch_target = lu_target
@@ -116,9 +144,18 @@ def _build_day_slots(
     else:
         afternoon_break_target = max(ab_target, lunch_target + cfg.lunch_duration_min + 80)
 
-    placed_morning_break = not can_morning
-    placed_lunch = not cfg.lunch_included
-    placed_afternoon_break = not cfg.afternoon_break
+    # Pending breaks/lunch as a min-heap of (target, order, kind, label, duration);
+    # the earliest target is always at pending[0].
+    pending: list[tuple[int, int, SlotKind, str, int]] = []
+    if can_morning:
+        pending.append((mb_target, 0, SlotKind.BREAK, "Morning Break", cfg.break_duration_min))
+    if cfg.lunch_included:
+        pending.append((lunch_target, 1, SlotKind.LUNCH, "Lunch", cfg.lunch_duration_min))
+    if cfg.afternoon_break:
+        pending.append((
+            afternoon_break_target, 2, SlotKind.BREAK, "Afternoon Break", cfg.break_duration_min,
+        ))
+    heapq.heapify(pending)
 
     # Track whether a room-change gap is needed before the next session
     need_room_change = False
@@ -135,9 +172,7 @@ def _build_day_slots(
     while cursor + cfg.presentation_duration_min <= end or prelim_idx < len(prelims):
         # Check if a plenary slot starts here (or before the next session)
         if prelim_idx < len(prelims):
-            ps = prelims[prelim_idx]
-            ps_start = _minutes(ps.start)
-            ps_end = _minutes(ps.end)
+            ps_start, ps_end, ps = prelims[prelim_idx]
             if ps_start <= cursor + cfg.room_change_penalty_min:
                 # Insert the plenary slot
                 ts = TimeSlot(
@@ -166,54 +201,33 @@ def _build_day_slots(
         # If we're past end but still have plenaries, advance to next plenary
         if cursor + cfg.presentation_duration_min > end:
             if prelim_idx < len(prelims):
-                cursor = _minutes(prelims[prelim_idx].start)
+                cursor = prelims[prelim_idx][0]
                 continue
             break
 
-        # Morning break
-        if not placed_morning_break and cursor >= morning_break_target:
-            ts = TimeSlot(
-                start=_fmt(cursor),
-                end=_fmt(cursor + cfg.break_duration_min),
-                kind=SlotKind.BREAK,
-                label="Morning Break",
-                day=day,
-            )
-            slots.append({"time_slot": ts, "sessions": []})
-            cursor += cfg.break_duration_min
-            placed_morning_break = True
-            need_room_change = False  # break already provides a gap
-            continue
-
-        # Lunch
-        if not placed_lunch and cursor >= lunch_target:
-            ts = TimeSlot(
-                start=_fmt(cursor),
-                end=_fmt(cursor + cfg.lunch_duration_min),
-                kind=SlotKind.LUNCH,
-                label="Lunch",
-                day=day,
-            )
-            slots.append({"time_slot": ts, "sessions": []})
-            cursor += cfg.lunch_duration_min
-            placed_lunch = True
-            is_afternoon = True
-            need_room_change = False  # lunch already provides a gap
-            continue
-
-        # Afternoon break
-        if not placed_afternoon_break and cursor >= afternoon_break_target:
+        # Next break or lunch, once its target time is reached
+        if pending and cursor >= pending[0][0]:
+            # A long plenary can overrun several targets at once; those are
+            # then placed in configuration order (morning break, lunch, ...).
+            entry = min((e for e in pending if e[0] <= cursor), key=itemgetter(1))
+            if entry is pending[0]:
+                heapq.heappop(pending)
+            else:
+                pending.remove(entry)
+                heapq.heapify(pending)
+            _target, _order, kind, label, duration = entry
             ts = TimeSlot(
                 start=_fmt(cursor),
-                end=_fmt(cursor + cfg.break_duration_min),
-                kind=SlotKind.BREAK,
-                label="Afternoon Break",
+                end=_fmt(cursor + duration),
+                kind=kind,
+                label=label,
                 day=day,
             )
             slots.append({"time_slot": ts, "sessions": []})
-            cursor += cfg.break_duration_min
-            placed_afternoon_break = True
-            need_room_change = False  # break already provides a gap
+            cursor += duration
+            if kind == SlotKind.LUNCH:
+                is_afternoon = True
+            need_room_change = False  # break/lunch already provides a gap
             continue
 
         # Apply room-change penalty gap before sessions
@@ -225,15 +239,10 @@ def _build_day_slots(
         sess_end = min(cursor + cfg.max_session_duration_min, end)
         # Don't overshoot into the next plenary
         if prelim_idx < len(prelims):
-            ps_start = _minutes(prelims[prelim_idx].start)
-            sess_end = min(sess_end, ps_start)
-        # Don't overshoot into upcoming lunch/break targets
-        if not placed_lunch:
-            sess_end = min(sess_end, lunch_target)
-        if not placed_morning_break:
-            sess_end = min(sess_end, morning_break_target)
-        if not placed_afternoon_break:
-            sess_end = min(sess_end, afternoon_break_target)
+            sess_end = min(sess_end, prelims[prelim_idx][0])
+        # Don't overshoot into the next lunch/break target
+        if pending:
+            sess_end = min(sess_end, pending[0][0])
 
         if sess_end - cursor < cfg.presentation_duration_min:
             cursor = sess_end
@@ -249,25 +258,23 @@ def _build_day_slots(
         # Create parallel sessions (one per room available)
         sessions: list[Session] = []
         rooms_this_day = min(cfg.num_available_rooms, cfg.max_rooms_per_day)
+        # Naming parts shared by all parallel sessions of this slot
+        period = "A" if is_afternoon else "M"
+        first_num = (afternoon_session_num if is_afternoon else morning_session_num) + 1
         for r in range(rooms_this_day):
             session_counter[0] += 1
             # Session naming: {DayPrefix}{M|A}{num} or fallback S{nn}
             if day_prefix:
-                period = "A" if is_afternoon else "M"
-                num = (afternoon_session_num if is_afternoon else morning_session_num) + r + 1
-                sid = f"{day_prefix}{period}{num:02d}"
+                sid = f"{day_prefix}{period}{first_num + r:02d}"
             else:
                 sid = f"S{session_counter[0]:02d}"
-            label = fixed_labels.get(sid, "")
-            is_fixed = sid in fixed_labels
-            sess = Session(
-                session_id=sid,
-                day=day,
-                time_slot=ts,
-                label=label,
-                is_fixed=is_fixed,
-            )
-            sessions.append(sess)
+            label = fixed_labels.get(sid)
+            # Positional (session_id, day, time_slot) keeps the per-room cost low
+            sessions.append(Session(
+                sid, day, ts,
+                label=label or "",
+                is_fixed=label is not None,
+            ))
         # Advance per-period counter by the number of parallel sessions
         if is_afternoon:
             afternoon_session_num += rooms_this_day
@@ -297,9 +304,18 @@ def _build_day_slots(
 def generate_dummy_program(cfg: ScheduleConfig) -> Program:
     """Create a skeleton programme respecting the schedule configuration."""
     counter = [0]  # mutable counter shared across days
+    # Config-derived lookups shared by every day
+    plenaries = _plenaries_by_day(cfg)
+    fixed_labels = _fixed_labels(cfg)
+    break_overrides = _parse_break_overrides(cfg)
     days: list[DayProgram] = []
     for d in range(1, cfg.num_days + 1):
-        day_slots = _build_day_slots(cfg, d, counter)
+        day_slots = _build_day_slots(
+            cfg, d, counter,
+            prelims=plenaries.get(d, []),
+            fixed_labels=fixed_labels,
+            break_overrides=break_overrides,
+        )
         days.append(DayProgram(day=d, slots=day_slots))
 
     meta = {
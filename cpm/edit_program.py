@@ -496,9 +496,9 @@ def list_sessions(program: Program) -> list[dict]:
             "session_id": sess.session_id,
             "day": day,
             "time": f"{ts.start}-{ts.end}",
-            "topic": sess.topic.name if sess.topic else "",
-            "room": sess.room.name if sess.room else "",
-            "chair": sess.chair.name if sess.chair else "",
+            "topic": sess.topic_name,
+            "room": sess.room_name,
+            "chair": sess.chair_name,
             "papers": len(sess.papers),
         })
     return rows
@@ -34,6 +34,17 @@ class SlotKind(str, Enum):
     ROOM_CHANGE = "room_change"
 
 
+# Value -> member lookups; cheaper than ``Enum(value)`` on hot load paths
+_OP_BY_VALUE: dict[str, ConstraintOp] = {o.value: o for o in ConstraintOp}
+_KIND_BY_VALUE: dict[str, SlotKind] = {k.value: k for k in SlotKind}
+
+
+def _slot_kind(value: str) -> SlotKind:
+    """Return the SlotKind for *value* (raises ValueError if unknown)."""
+    kind = _KIND_BY_VALUE.get(value)
+    return kind if kind is not None else SlotKind(value)
+
+
 # ---------------------------------------------------------------------------
 # Small value objects
 # ---------------------------------------------------------------------------
@@ -125,7 +136,7 @@ class Constraint:
         subj_type = parts[0]
         subj_id = parts[1] if len(parts) > 1 else ""
 
-        op = ConstraintOp(op_str)
+        op = _OP_BY_VALUE[op_str]  # guaranteed by _PATTERN
 
         # Parse value: could be {a, b, c} set or "string" or bare token
         if raw_val.startswith("{") and raw_val.endswith("}"):
@@ -197,6 +208,24 @@ class Session:
     label: str = ""
     is_fixed: bool = False
 
+    # Flat name accessors ("" when unassigned).  Plain properties rather than
+    # cached ones: a cache would go stale on reassignment and would end up in
+    # ``__dict__``, which is what gets serialised.
+    @property
+    def room_name(self) -> str:
+        room = self.room
+        return room.name if room is not None else ""
+
+    @property
+    def topic_name(self) -> str:
+        topic = self.topic
+        return topic.name if topic is not None else ""
+
+    @property
+    def chair_name(self) -> str:
+        chair = self.chair
+        return chair.name if chair is not None else ""
+
     @property
     def capacity(self) -> int:
         if self.time_slot is None:
@@ -229,11 +258,27 @@ class Program:
     def from_dict(cls, d: dict) -> "Program":
         return _program_from_dict(d)
 
+    def to_json_bytes(self) -> bytes:
+        """The exact bytes :meth:`save` writes (2-space indented UTF-8 JSON).
+
+        Serialised through the optional ``orjson`` package when it is
+        installed, falling back to the stdlib for anything orjson rejects
+        (e.g. non-string keys in user-supplied ``extra`` dicts).
+        """
+        d = self.to_dict()
+        try:
+            import orjson
+        except ImportError:
+            pass
+        else:
+            try:
+                return orjson.dumps(d, option=orjson.OPT_INDENT_2)
+            except TypeError:
+                pass
+        return json.dumps(d, indent=2, ensure_ascii=False).encode("utf-8")
+
     def save(self, path: str | Path) -> None:
-        Path(path).write_text(
-            json.dumps(self.to_dict(), indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        Path(path).write_bytes(self.to_json_bytes())
 
     @classmethod
     def load(cls, path: str | Path) -> "Program":
@@ -341,8 +386,15 @@ def _resolve_spec(spec: str | list[str], columns: list[str]) -> list[str]:
 # Serialization helpers
 # ---------------------------------------------------------------------------
 
+_PLAIN_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
 def _to_dict(obj: Any) -> Any:
     """Recursively convert dataclass instances to dicts."""
+    # Most leaves are plain values; test their exact type first (str-based
+    # enums are subclasses and fall through to the Enum branch).
+    if type(obj) in _PLAIN_TYPES:
+        return obj
     if isinstance(obj, Enum):
         return obj.value
     if hasattr(obj, "__dataclass_fields__"):
@@ -354,6 +406,9 @@ def _to_dict(obj: Any) -> Any:
     return obj
 
 
+_CHAIR_FIELDS = frozenset(Chair.__dataclass_fields__)
+
+
 def _program_from_dict(d: dict) -> Program:
     """Reconstruct a Program from a dict (loaded from JSON)."""
     days: list[DayProgram] = []
@@ -364,7 +419,7 @@ def _program_from_dict(d: dict) -> Program:
             ts = TimeSlot(
                 start=ts_raw.get("start", ""),
                 end=ts_raw.get("end", ""),
-                kind=SlotKind(ts_raw.get("kind", "session")),
+                kind=_slot_kind(ts_raw.get("kind", "session")),
                 label=ts_raw.get("label", ""),
                 day=ts_raw.get("day", dd.get("day", 1)),
                 chair=ts_raw.get("chair", ""),
@@ -386,7 +441,7 @@ def _session_from_dict(d: dict) -> Session:
         ts = TimeSlot(
             start=ts_raw.get("start", ""),
             end=ts_raw.get("end", ""),
-            kind=SlotKind(ts_raw.get("kind", "session")),
+            kind=_slot_kind(ts_raw.get("kind", "session")),
             label=ts_raw.get("label", ""),
             day=ts_raw.get("day", 1),
             chair=ts_raw.get("chair", ""),
@@ -398,8 +453,7 @@ def _session_from_dict(d: dict) -> Session:
     room = Room(**room_raw) if room_raw else None
     chair_raw = d.get("chair")
     if chair_raw:
-        _chair_fields = {f for f in Chair.__dataclass_fields__}
-        chair = Chair(**{k: v for k, v in chair_raw.items() if k in _chair_fields})
+        chair = Chair(**{k: v for k, v in chair_raw.items() if k in _CHAIR_FIELDS})
     else:
         chair = None
     papers = []
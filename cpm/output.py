@@ -4,177 +4,221 @@ from __future__ import annotations
 
 import csv
 import io
+import itertools
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterable, Iterator, Sequence, TextIO
 
 from .models import Paper, Program, Session, SlotKind, TimeSlot, build_topic_display_names
 
 
+# Breaks and meals: rendered as a single heading line, no sessions
+_NON_SESSION_KINDS = frozenset({SlotKind.BREAK, SlotKind.LUNCH, SlotKind.DINNER})
+
+
 # ---------------------------------------------------------------------------
 # Markdown
 # ---------------------------------------------------------------------------
 
-def program_to_markdown(program: Program) -> str:
-    """Render the full programme as Markdown."""
-    topic_names = build_topic_display_names(program)
-    lines: list[str] = []
-    lines.append("# Conference Programme\n")
+def _iter_rendered(program: Program):
+    """Flatten *program* once for the Markdown and LaTeX renderers.
 
+    Yields ``(day, rows)`` per day, where each row is ``(time_slot, entries)``
+    and each entry is ``(session, topic_name, room_name, chair_name)``.
+    Room and chair names are ``None`` when unassigned.  Only regular session
+    slots carry entries; breaks, meals and plenaries get an empty list.
+    """
+    topic_names = build_topic_display_names(program)
     for day_prog in program.days:
-        lines.append(f"## Day {day_prog.day}\n")
-
+        rows: list[tuple[TimeSlot, list]] = []
         for slot in day_prog.slots:
             ts: TimeSlot = slot["time_slot"]
-            sessions: list[Session] = slot["sessions"]
+            entries = []
+            if ts.kind not in _NON_SESSION_KINDS and ts.kind != SlotKind.PLENARY:
+                for sess in slot["sessions"]:
+                    topic, room, chair = sess.topic, sess.room, sess.chair
+                    entries.append((
+                        sess,
+                        topic_names.get(sess.session_id, topic.name if topic else ""),
+                        room.name if room else None,
+                        chair.name if chair else None,
+                    ))
+            rows.append((ts, entries))
+        yield day_prog.day, rows
+
+
+@lru_cache(maxsize=4096)
+def _render_session_header_md(
+    session_id: str, topic_name: str, room: str | None, chair: str | None,
+) -> str:
+    """Markdown heading for one session (memoized across renders)."""
+    room_str = f" — *{room}*" if room is not None else ""
+    topic_str = f" [{topic_name}]" if topic_name else ""
+    chair_str = f" (Chair: {chair})" if chair is not None else ""
+    return f"#### {session_id}{topic_str}{room_str}{chair_str}\n\n"
 
-            if ts.kind in (SlotKind.BREAK, SlotKind.LUNCH, SlotKind.DINNER):
-                lines.append(f"### {ts.start}–{ts.end}  {ts.label}\n")
+
+def program_to_markdown(program: Program) -> str:
+    """Render the full programme as Markdown."""
+    buf = io.StringIO()
+    write = buf.write
+    # Hot-loop globals bound to locals
+    header_md = _render_session_header_md
+    non_session, PLENARY = _NON_SESSION_KINDS, SlotKind.PLENARY
+    write("# Conference Programme\n")
+
+    for day, rows in _iter_rendered(program):
+        write(f"\n## Day {day}\n\n")
+
+        for ts, entries in rows:
+            if ts.kind in non_session:
+                write(f"### {ts.start}–{ts.end}  {ts.label}\n\n")
                 continue
 
-            if ts.kind == SlotKind.PLENARY:
+            if ts.kind == PLENARY:
                 extra = ""
                 if ts.speaker:
                     extra += f" — *{ts.speaker}*"
                 if ts.chair:
                     extra += f" (Chair: {ts.chair})"
-                lines.append(f"### {ts.start}–{ts.end}  {ts.label}{extra} *(reserved)*\n")
+                write(f"### {ts.start}–{ts.end}  {ts.label}{extra} *(reserved)*\n\n")
                 continue
 
             # Session slot
-            lines.append(f"### {ts.start}–{ts.end}  Sessions\n")
-
-            for sess in sessions:
-                room_str = f" — *{sess.room.name}*" if sess.room else ""
-                tn = topic_names.get(sess.session_id, sess.topic.name if sess.topic else "")
-                topic_str = f" [{tn}]" if tn else ""
-                chair_str = f" (Chair: {sess.chair.name})" if sess.chair else ""
-                lines.append(
-                    f"#### {sess.session_id}{topic_str}{room_str}{chair_str}\n"
-                )
+            write(f"### {ts.start}–{ts.end}  Sessions\n\n")
+
+            for sess, tn, room, chair in entries:
+                write(header_md(sess.session_id, tn, room, chair))
 
                 if not sess.papers:
-                    lines.append("*No papers assigned.*\n")
+                    write("*No papers assigned.*\n\n")
                 else:
                     for p in sess.papers:
                         authors = ", ".join(a.name for a in p.authors)
-                        lines.append(f"- **{p.title}**  ")
-                        lines.append(f"  {authors}\n")
+                        write(f"- **{p.title}**  \n  {authors}\n\n")
 
-        lines.append("---\n")
+        write("---\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 # ---------------------------------------------------------------------------
 # LaTeX
 # ---------------------------------------------------------------------------
 
+_TEX_TABLE = str.maketrans({
+    "&": r"\&",
+    "%": r"\%",
+    "$": r"\$",
+    "#": r"\#",
+    "_": r"\_",
+    "{": r"\{",
+    "}": r"\}",
+    "~": r"\textasciitilde{}",
+    "^": r"\textasciicircum{}",
+})
+
+
+@lru_cache(maxsize=8192)
 def _tex_escape(text: str) -> str:
     """Escape special LaTeX characters."""
-    replacements = {
-        "&": r"\&",
-        "%": r"\%",
-        "$": r"\$",
-        "#": r"\#",
-        "_": r"\_",
-        "{": r"\{",
-        "}": r"\}",
-        "~": r"\textasciitilde{}",
-        "^": r"\textasciicircum{}",
-    }
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-    return text
+    return text.translate(_TEX_TABLE)
 
 
-def program_to_latex(program: Program) -> str:
-    """Render the full programme as a standalone LaTeX document."""
-    lines: list[str] = []
-    lines.append(r"\documentclass[a4paper,11pt]{article}")
-    lines.append(r"\usepackage[utf8]{inputenc}")
-    lines.append(r"\usepackage[T1]{fontenc}")
-    lines.append(r"\usepackage{booktabs}")
-    lines.append(r"\usepackage{longtable}")
-    lines.append(r"\usepackage{geometry}")
-    lines.append(r"\geometry{margin=2cm}")
-    lines.append(r"\usepackage{enumitem}")
-    lines.append(r"\usepackage{titlesec}")
-    lines.append(r"\titleformat{\section}{\Large\bfseries}{Day~\thesection}{1em}{}")
-    lines.append(r"\begin{document}")
-    lines.append(r"\begin{center}")
-    lines.append(r"{\LARGE\bfseries Conference Programme}\\[1em]")
-    lines.append(r"\end{center}")
-    lines.append("")
+@lru_cache(maxsize=4096)
+def _render_session_header_tex(
+    session_id: str, topic_name: str, room: str | None, chair: str | None,
+) -> str:
+    """LaTeX ``\\paragraph`` heading for one session (memoized across renders)."""
+    topic_str = (
+        f" -- {_tex_escape(topic_name)}" if topic_name else ""
+    )
+    room_str = (
+        f" \\textit{{{_tex_escape(room)}}}" if room is not None else ""
+    )
+    chair_str = (
+        f" (Chair: {_tex_escape(chair)})" if chair is not None else ""
+    )
+    return (
+        f"\\paragraph{{{_tex_escape(session_id)}"
+        f"{topic_str}{room_str}{chair_str}}}\n"
+    )
 
-    topic_names = build_topic_display_names(program)
 
-    for day_prog in program.days:
-        lines.append(f"\\section*{{Day {day_prog.day}}}")
-        lines.append("")
+_LATEX_PREAMBLE = r"""\documentclass[a4paper,11pt]{article}
+\usepackage[utf8]{inputenc}
+\usepackage[T1]{fontenc}
+\usepackage{booktabs}
+\usepackage{longtable}
+\usepackage{geometry}
+\geometry{margin=2cm}
+\usepackage{enumitem}
+\usepackage{titlesec}
+\titleformat{\section}{\Large\bfseries}{Day~\thesection}{1em}{}
+\begin{document}
+\begin{center}
+{\LARGE\bfseries Conference Programme}\\[1em]
+\end{center}
 
-        for slot in day_prog.slots:
-            ts: TimeSlot = slot["time_slot"]
-            sessions: list[Session] = slot["sessions"]
+"""
 
-            if ts.kind in (SlotKind.BREAK, SlotKind.LUNCH, SlotKind.DINNER):
-                lines.append(
+
+def program_to_latex(program: Program) -> str:
+    """Render the full programme as a standalone LaTeX document."""
+    buf = io.StringIO()
+    write = buf.write
+    # Hot-loop globals bound to locals
+    esc, header_tex = _tex_escape, _render_session_header_tex
+    non_session, PLENARY = _NON_SESSION_KINDS, SlotKind.PLENARY
+    write(_LATEX_PREAMBLE)
+
+    for day, rows in _iter_rendered(program):
+        write(f"\\section*{{Day {day}}}\n\n")
+
+        for ts, entries in rows:
+            if ts.kind in non_session:
+                write(
                     f"\\subsection*{{{ts.start}--{ts.end} \\quad "
-                    f"\\textit{{{_tex_escape(ts.label)}}}}}"
+                    f"\\textit{{{esc(ts.label)}}}}}\n\n"
                 )
-                lines.append("")
                 continue
 
-            if ts.kind == SlotKind.PLENARY:
+            if ts.kind == PLENARY:
                 extra = ""
                 if ts.speaker:
-                    extra += f" -- {_tex_escape(ts.speaker)}"
+                    extra += f" -- {esc(ts.speaker)}"
                 if ts.chair:
-                    extra += f" (Chair: {_tex_escape(ts.chair)})"
-                lines.append(
+                    extra += f" (Chair: {esc(ts.chair)})"
+                write(
                     f"\\subsection*{{{ts.start}--{ts.end} \\quad "
-                    f"{_tex_escape(ts.label)}{extra} (reserved)}}"
+                    f"{esc(ts.label)}{extra} (reserved)}}\n\n"
                 )
-                lines.append("")
                 continue
 
-            lines.append(f"\\subsection*{{{ts.start}--{ts.end} \\quad Sessions}}")
-            lines.append("")
+            write(f"\\subsection*{{{ts.start}--{ts.end} \\quad Sessions}}\n\n")
 
-            for sess in sessions:
-                tn = topic_names.get(sess.session_id, sess.topic.name if sess.topic else "")
-                topic_str = (
-                    f" -- {_tex_escape(tn)}" if tn else ""
-                )
-                room_str = (
-                    f" \\textit{{{_tex_escape(sess.room.name)}}}" if sess.room else ""
-                )
-                chair_str = (
-                    f" (Chair: {_tex_escape(sess.chair.name)})" if sess.chair else ""
-                )
-                lines.append(
-                    f"\\paragraph{{{_tex_escape(sess.session_id)}"
-                    f"{topic_str}{room_str}{chair_str}}}"
-                )
+            for sess, tn, room, chair in entries:
+                write(header_tex(sess.session_id, tn, room, chair))
 
                 if sess.papers:
-                    lines.append(r"\begin{itemize}[leftmargin=*]")
+                    write("\\begin{itemize}[leftmargin=*]\n")
                     for p in sess.papers:
                         authors = ", ".join(
-                            _tex_escape(a.name) for a in p.authors
+                            esc(a.name) for a in p.authors
                         )
-                        lines.append(
-                            f"  \\item \\textbf{{{_tex_escape(p.title)}}} "
-                            f"\\\\ {authors}"
+                        write(
+                            f"  \\item \\textbf{{{esc(p.title)}}} "
+                            f"\\\\ {authors}\n"
                         )
-                    lines.append(r"\end{itemize}")
+                    write("\\end{itemize}\n")
                 else:
-                    lines.append(r"\emph{No papers assigned.}")
-                lines.append("")
+                    write("\\emph{No papers assigned.}\n")
+                write("\n")
 
-        lines.append(r"\bigskip\hrule\bigskip")
-        lines.append("")
+        write("\\bigskip\\hrule\\bigskip\n\n")
 
-    lines.append(r"\end{document}")
-    return "\n".join(lines)
+    write(r"\end{document}")
+    return buf.getvalue()
 
 
 # ---------------------------------------------------------------------------
@@ -185,10 +229,11 @@ def program_to_latex(program: Program) -> str:
 # CMS CSV output
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1024)
 def _time_to_seconds(t: str) -> int:
-    """Convert HH:MM to seconds since midnight."""
-    parts = t.replace(".", ":").split(":")
-    return int(parts[0]) * 3600 + int(parts[1]) * 60
+    """Convert HH:MM (or HH.MM) to seconds since midnight."""
+    h, _, m = t.partition(":" if ":" in t else ".")
+    return int(h) * 3600 + int(m[:2]) * 60
 
 
 def _collect_session_slots(program: Program) -> list[tuple[Session, TimeSlot, int]]:
@@ -204,26 +249,84 @@ def _collect_session_slots(program: Program) -> list[tuple[Session, TimeSlot, in
     return result
 
 
+def _quote_all_lines(rows: Iterable[Sequence[str]], sep: str) -> Iterator[str]:
+    """Yield CSV lines equal to ``csv.writer(quoting=csv.QUOTE_ALL)`` output.
+
+    With every field quoted, only embedded quote characters need escaping
+    (by doubling), so a plain ``str.join`` reproduces the csv module's
+    default dialect byte-for-byte, ``\\r\\n`` line terminator included.
+    """
+    glue = f'"{sep}"'
+    for row in rows:
+        line = glue.join(row)
+        if '"' in line:
+            line = glue.join([f.replace('"', '""') for f in row])
+        yield f'"{line}"\r\n'
+
+
+def _write_cms_sessions(
+    program: Program,
+    fileobj: TextIO,
+    sep: str = ";",
+    *,
+    _slots: list[tuple[Session, TimeSlot, int]] | None = None,
+) -> None:
+    """Write the CMS sessions CSV rows to the text stream *fileobj*.
+
+    *_slots* may carry a precomputed :func:`_collect_session_slots` result.
+    """
+    topic_names = build_topic_display_names(program)
+    header = ("session_id", "name", "room", "topic", "chair", "day", "begin")
+    # name = session id; begin = seconds since midnight
+    rows = (
+        (
+            sess.session_id,
+            sess.session_id,
+            sess.room_name,
+            topic_names.get(sess.session_id, sess.topic_name),
+            sess.chair_name,
+            str(day),
+            str(_time_to_seconds(ts.start)),
+        )
+        for sess, ts, day in (_slots if _slots is not None else _collect_session_slots(program))
+    )
+    fileobj.writelines(_quote_all_lines(itertools.chain((header,), rows), sep))
+
+
+def _write_cms_presentations(
+    program: Program,
+    fileobj: TextIO,
+    presentation_duration: int = 1200,
+    sep: str = ";",
+    *,
+    _slots: list[tuple[Session, TimeSlot, int]] | None = None,
+) -> None:
+    """Write the CMS presentations CSV rows to the text stream *fileobj*.
+
+    *_slots* may carry a precomputed :func:`_collect_session_slots` result.
+    """
+    header = ("presentation_id", "session_id", "number", "paper_id", "duration")
+    duration = str(presentation_duration)  # identical for every row
+    talks = (
+        (sess.session_id, idx, paper.paper_id)
+        for sess, _ts, _day in (_slots if _slots is not None else _collect_session_slots(program))
+        for idx, paper in enumerate(sess.papers, start=1)
+    )
+    rows = (
+        (str(pres_id), sid, str(idx), str(pid), duration)
+        for pres_id, (sid, idx, pid) in enumerate(talks, start=1)
+    )
+    fileobj.writelines(_quote_all_lines(itertools.chain((header,), rows), sep))
+
+
 def program_to_cms_sessions(program: Program, sep: str = ";") -> str:
     """Generate a CMS-style sessions CSV.
 
     Columns: session_id, name, room, topic, chair, day, begin
     (begin is in seconds since midnight).
     """
-    topic_names = build_topic_display_names(program)
     buf = io.StringIO()
-    writer = csv.writer(buf, delimiter=sep, quoting=csv.QUOTE_ALL)
-    writer.writerow(["session_id", "name", "room", "topic", "chair", "day", "begin"])
-
-    for sess, ts, day in _collect_session_slots(program):
-        sid = sess.session_id
-        name = sid
-        room = sess.room.name if sess.room else ""
-        topic = topic_names.get(sess.session_id, sess.topic.name if sess.topic else "")
-        chair = sess.chair.name if sess.chair else ""
-        begin = _time_to_seconds(ts.start)
-        writer.writerow([sid, name, room, topic, chair, str(day), str(begin)])
-
+    _write_cms_sessions(program, buf, sep)
     return buf.getvalue()
 
 
@@ -236,18 +339,7 @@ def program_to_cms_presentations(
     (duration is in seconds).
     """
     buf = io.StringIO()
-    writer = csv.writer(buf, delimiter=sep, quoting=csv.QUOTE_ALL)
-    writer.writerow(["presentation_id", "session_id", "number", "paper_id", "duration"])
-
-    pres_id = 1
-    for sess, ts, _day in _collect_session_slots(program):
-        for idx, paper in enumerate(sess.papers, start=1):
-            writer.writerow([
-                str(pres_id), sess.session_id, str(idx),
-                str(paper.paper_id), str(presentation_duration),
-            ])
-            pres_id += 1
-
+    _write_cms_presentations(program, buf, presentation_duration, sep)
     return buf.getvalue()
 
 
@@ -258,27 +350,81 @@ def write_cms_csvs(
     presentation_duration: int = 1200,
     sep: str = ";",
 ) -> None:
-    """Write both CMS CSV files."""
-    Path(sessions_path).write_text(
-        program_to_cms_sessions(program, sep=sep), encoding="utf-8"
-    )
-    Path(presentations_path).write_text(
-        program_to_cms_presentations(program, presentation_duration, sep=sep),
-        encoding="utf-8",
-    )
+    """Write both CMS CSV files.
+
+    Rows are streamed straight to disk rather than built up in memory first.
+    The two files are independent and written from two threads, so on a
+    slow (e.g. network) filesystem their writes overlap.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    slots = _collect_session_slots(program)  # walk the programme once for both files
+
+    def sessions() -> None:
+        with Path(sessions_path).open("w", newline="", encoding="utf-8") as f:
+            _write_cms_sessions(program, f, sep, _slots=slots)
+
+    def presentations() -> None:
+        with Path(presentations_path).open("w", newline="", encoding="utf-8") as f:
+            _write_cms_presentations(program, f, presentation_duration, sep, _slots=slots)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(sessions), pool.submit(presentations)]
+        for fut in futures:
+            fut.result()  # re-raise any write error
 
 
 # ---------------------------------------------------------------------------
 # Convenience writer
 # ---------------------------------------------------------------------------
 
+def _render(program: Program, fmt: str) -> str:
+    if fmt == "latex":
+        return program_to_latex(program)
+    return program_to_markdown(program)
+
+
 def write_program(program: Program, path: str | Path, fmt: str = "md") -> None:
     """Write the programme to *path* in the given format ('md' or 'latex')."""
-    if fmt == "latex":
-        text = program_to_latex(program)
-    else:
-        text = program_to_markdown(program)
-    Path(path).write_text(text, encoding="utf-8")
+    Path(path).write_text(_render(program, fmt), encoding="utf-8")
+
+
+def write_bytes_if_changed(path: str | Path, data: bytes) -> bool:
+    """Write *data* to *path* unless the file already holds exactly *data*.
+
+    An untouched file keeps its mtime, so make/watch tools downstream do
+    not rebuild.  Returns True if the file was written.
+    """
+    target = Path(path)
+    try:
+        if target.stat().st_size == len(data) and target.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    target.write_bytes(data)
+    return True
+
+
+def save_and_render(
+    program: Program,
+    json_path: str | Path,
+    render_path: str | Path,
+    fmt: str = "md",
+) -> bool:
+    """Write *program*'s JSON on a helper thread while rendering it.
+
+    The JSON is serialised first and then written by a helper thread (left
+    untouched when unchanged, see :func:`write_bytes_if_changed`) while
+    this thread renders the Markdown/LaTeX to *render_path* in a separate
+    walk.  Returns True if the JSON file was written.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    data = program.to_json_bytes()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        saved = pool.submit(write_bytes_if_changed, json_path, data)
+        Path(render_path).write_text(_render(program, fmt), encoding="utf-8")
+        return saved.result()
 
 
 # ---------------------------------------------------------------------------
@@ -14,20 +14,30 @@ venue, editors, colours, …).
 
 from __future__ import annotations
 
+import io
 import json
 import logging
 import shutil
+from string import Template
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from .models import Program, SlotKind, TimeSlot, build_topic_display_names
+from .models import DayProgram, Program, SlotKind, TimeSlot, build_topic_display_names
 
 logger = logging.getLogger(__name__)
 
+# Breaks and meals: close the current session period, nothing rendered
+_NON_SESSION_KINDS = frozenset({SlotKind.BREAK, SlotKind.LUNCH, SlotKind.DINNER})
+
 
 # ---------------------------------------------------------------------------
 # LaTeX config dataclass
 # ---------------------------------------------------------------------------
 
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
 @dataclass
 class LaTeXConfig:
     """Conference metadata used to fill the LaTeX templates."""
@@ -53,34 +63,44 @@ class LaTeXConfig:
         "sesbox": ".8,.8,1",
     })
     extra: dict = field(default_factory=dict)
+    # day -> (name, date, heading); filled lazily, never saved
+    _day_cache: dict[int, tuple[str, str, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
 
     # ------------------------------------------------------------------
     def save(self, path: str | Path) -> None:
-        d = self.__dict__.copy()
+        d = {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
         Path(path).write_text(json.dumps(d, indent=2, ensure_ascii=False))
 
     @classmethod
     def load(cls, path: str | Path) -> "LaTeXConfig":
         raw = json.loads(Path(path).read_text())
-        return cls(**{k: v for k, v in raw.items() if k in cls.__dataclass_fields__})
+        fields = cls.__dataclass_fields__
+        return cls(**{k: v for k, v in raw.items() if k in fields and fields[k].init})
+
+    def _day_labels(self, day: int) -> tuple[str, str, str]:
+        labels = self._day_cache.get(day)
+        if labels is None:
+            if self.day_names and day - 1 < len(self.day_names):
+                name = self.day_names[day - 1]
+            else:
+                name = _WEEKDAYS[(day - 1) % 7]
+            date = ""
+            if self.day_dates and day - 1 < len(self.day_dates):
+                date = self.day_dates[day - 1]
+            heading = f"{name}, {date}" if date else f"{name} — Day {day}"
+            labels = self._day_cache[day] = (name, date, heading)
+        return labels
 
     def day_name(self, day: int) -> str:
-        if self.day_names and day - 1 < len(self.day_names):
-            return self.day_names[day - 1]
-        weekdays = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-        return weekdays[(day - 1) % 7]
+        return self._day_labels(day)[0]
 
     def day_date(self, day: int) -> str:
-        if self.day_dates and day - 1 < len(self.day_dates):
-            return self.day_dates[day - 1]
-        return ""
+        return self._day_labels(day)[1]
 
     def full_day_heading(self, day: int) -> str:
-        name = self.day_name(day)
-        date = self.day_date(day)
-        if date:
-            return f"{name}, {date}"
-        return f"{name} — Day {day}"
+        return self._day_labels(day)[2]
 
 
 # ---------------------------------------------------------------------------
@@ -100,10 +120,19 @@ _TEX_REPLACEMENTS = {
 }
 
 
+_TEX_TABLE = str.maketrans(_TEX_REPLACEMENTS)
+
+# Padding for the three author slots of \puttalk
+_NO_AUTHORS = [("", "")] * 3
+
+# Blank line, \medskip\nopagebreak, blank line — follows every heading
+_MEDSKIP = "\n\\medskip\\nopagebreak\n\n"
+
+
+@lru_cache(maxsize=8192)
 def _esc(text: str) -> str:
-    for old, new in _TEX_REPLACEMENTS.items():
-        text = text.replace(old, new)
-    return text
+    # Names, rooms and topics repeat across the programme; memoized.
+    return text.translate(_TEX_TABLE)
 
 
 # ---------------------------------------------------------------------------
@@ -237,168 +266,182 @@ without prior permission in writing from the publisher.
 """
 
 
-def _gen_main(
-    lcfg: LaTeXConfig,
-    day_files: list[str],
-    *,
-    with_comments: bool = False,
-    with_abstracts: bool = False,
-) -> str:
-    """Generate main.tex (master document)."""
-    header_left = _esc(lcfg.header_left or f"{lcfg.edition} {lcfg.conference_title}")
-    header_right = _esc(lcfg.header_right)
-    pdf_title = f"{lcfg.document_title} {lcfg.edition} {lcfg.conference_title}"
-
-    col = lcfg.colors
-    daybox = col.get("daybox", "1,.2,.2")
-    plebox = col.get("plebox", ".4,0,.8")
-    sesbox = col.get("sesbox", ".8,.8,1")
-
-    comments_block = ""
-    if with_comments:
-        comments_block = (
-            "\n%% -- COMMENTS (general info + programme tables) -- %%\n"
-            "\\onecolumn\n"
-            "\\input{comments}\n"
-            "\\cleardoublepage \\mbox{} \\vspace*{6cm}\n"
-        )
-
-    abstracts_block = ""
-    if with_abstracts:
-        abstracts_block = (
-            "\n%% -- ABSTRACTS -- %%\n"
-            "\\onecolumn \\cleardoublepage \\mbox{} \\vspace*{6cm}\n"
-            "\\begin{center}\n"
-            "\\Huge\\textbf{Part 3\\\\[2ex] Abstracts}\n"
-            "\\end{center}\n"
-            "\\cleardoublepage\n"
-            "\\input{abstracts}\n"
-        )
-
-    return f"""\\documentclass[a4paper]{{book}}
+# main.tex skeleton; parsed once, filled by _gen_main via Template.substitute
+_MAIN_TEMPLATE = Template(r"""\documentclass[a4paper]{book}
 %%
 %% -- USED PACKAGES --
 %%
-\\usepackage{{amsmath,amsfonts,amssymb}}
-\\usepackage[pdftex]{{graphicx}}
-\\usepackage[table,fixpdftex]{{xcolor}}
-\\usepackage{{latexsym}}
-\\usepackage{{ifthen}}
-\\usepackage{{tabularx}}
-\\usepackage{{lscape}}
-\\usepackage{{fancyhdr}}
-\\usepackage{{pdfpages}}
-\\usepackage[]{{inputenc}}
-\\usepackage[T1]{{fontenc}}
-\\usepackage{{amstext}}
-\\usepackage[pdftex]{{hyperref}}
+\usepackage{amsmath,amsfonts,amssymb}
+\usepackage[pdftex]{graphicx}
+\usepackage[table,fixpdftex]{xcolor}
+\usepackage{latexsym}
+\usepackage{ifthen}
+\usepackage{tabularx}
+\usepackage{lscape}
+\usepackage{fancyhdr}
+\usepackage{pdfpages}
+\usepackage[]{inputenc}
+\usepackage[T1]{fontenc}
+\usepackage{amstext}
+\usepackage[pdftex]{hyperref}
 
 %%
 %% -- COLOR DEFINITIONS
 %%
-\\newcommand{{\\RED}}[1]{{{{\\textcolor{{red}}{{#1}}}}}}
-\\definecolor{{bmscred}}{{rgb}}{{{daybox}}}
-\\definecolor{{bmscdark}}{{rgb}}{{{plebox}}}
-\\definecolor{{bmscblue}}{{rgb}}{{{sesbox}}}
-\\definecolor{{daybox}}{{rgb}}{{{daybox}}}
-\\definecolor{{plebox}}{{rgb}}{{{plebox}}}
-\\definecolor{{sesbox}}{{rgb}}{{{sesbox}}}
-\\definecolor{{fdaybox}}{{rgb}}{{{daybox}}}
-\\definecolor{{fplebox}}{{rgb}}{{{plebox}}}
-\\definecolor{{fsesbox}}{{rgb}}{{{sesbox}}}
-\\definecolor{{day}}{{gray}}{{0}}
-\\definecolor{{ple}}{{gray}}{{1}}
-\\definecolor{{ses}}{{gray}}{{0}}
+\newcommand{\RED}[1]{{\textcolor{red}{#1}}}
+\definecolor{bmscred}{rgb}{${daybox}}
+\definecolor{bmscdark}{rgb}{${plebox}}
+\definecolor{bmscblue}{rgb}{${sesbox}}
+\definecolor{daybox}{rgb}{${daybox}}
+\definecolor{plebox}{rgb}{${plebox}}
+\definecolor{sesbox}{rgb}{${sesbox}}
+\definecolor{fdaybox}{rgb}{${daybox}}
+\definecolor{fplebox}{rgb}{${plebox}}
+\definecolor{fsesbox}{rgb}{${sesbox}}
+\definecolor{day}{gray}{0}
+\definecolor{ple}{gray}{1}
+\definecolor{ses}{gray}{0}
 
 %%
 %% -- WIDTHS
 %%
-\\newlength{{\\myboxwidth}}
-\\newlength{{\\colw}}
-\\setlength{{\\colw}}{{244mm}}
+\newlength{\myboxwidth}
+\newlength{\colw}
+\setlength{\colw}{244mm}
 
 %%
 %% -- HYPERREF
 %%
-\\hypersetup{{pdftitle={{{_esc(pdf_title)}}},
-pdfsubject={{{_esc(lcfg.conference_title)}}},
-pdfkeywords={{}}, pdfcreator={{\\LaTeX}}, colorlinks=true}}
+\hypersetup{pdftitle={${pdf_title}},
+pdfsubject={${conference_title}},
+pdfkeywords={}, pdfcreator={\LaTeX}, colorlinks=true}
 
 %%
 %% -- COMMANDS
 %%
-\\input{{commands}}
+\input{commands}
 
 %%
 %% -- VARIABLES
 %%
-\\newcounter{{sp}}
-\\setcounter{{sp}}{{21}}
-\\newcounter{{a}}
+\newcounter{sp}
+\setcounter{sp}{21}
+\newcounter{a}
 
 %%
 %% -- PAGE LAYOUT
 %%
-\\topmargin -8.9mm \\headheight 5mm \\headsep 5mm \\textwidth 178mm
-\\textheight 244mm \\columnsep 8mm \\oddsidemargin -9.4mm
-\\evensidemargin -9.4mm
-\\parindent 0em
-\\parskip 1ex plus 0.1ex minus 0.1ex
-\\pagestyle{{fancy}} \\fancyhead[LE,RO]{{\\rmfamily {header_right}}}
-\\fancyhead[LO,RE]{{\\rmfamily {header_left}}} \\fancyfoot[C]{{\\rmfamily\\thepage}}
-\\renewcommand{{\\headrulewidth}}{{0.4pt}}
-\\renewcommand{{\\footrulewidth}}{{0pt}}
-\\frenchspacing \\sloppy
-
-\\begin{{document}}
+\topmargin -8.9mm \headheight 5mm \headsep 5mm \textwidth 178mm
+\textheight 244mm \columnsep 8mm \oddsidemargin -9.4mm
+\evensidemargin -9.4mm
+\parindent 0em
+\parskip 1ex plus 0.1ex minus 0.1ex
+\pagestyle{fancy} \fancyhead[LE,RO]{\rmfamily ${header_right}}
+\fancyhead[LO,RE]{\rmfamily ${header_left}} \fancyfoot[C]{\rmfamily\thepage}
+\renewcommand{\headrulewidth}{0.4pt}
+\renewcommand{\footrulewidth}{0pt}
+\frenchspacing \sloppy
+
+\begin{document}
 
 %% -- FRONT -- %%
-\\input{{front}}
-\\cleardoublepage \\mbox{{}} \\vspace*{{6cm}}
+\input{front}
+\cleardoublepage \mbox{} \vspace*{6cm}
 
 %% -- PROGRAM -- %%
-\\begin{{center}}
-\\Huge\\textbf{{Part 1\\\\[2ex] Programmatic Table of Contents}}
-\\end{{center}}
+\begin{center}
+\Huge\textbf{Part 1\\[2ex] Programmatic Table of Contents}
+\end{center}
 
-\\hypertarget{{P:1}}{{}} \\label{{P:1}} \\twocolumn \\cleardoublepage
-\\pagestyle{{fancy}}
+\hypertarget{P:1}{} \label{P:1} \twocolumn \cleardoublepage
+\pagestyle{fancy}
 
-\\input{{program}}
+\input{program}
 
-\\medskip\\nopagebreak
+\medskip\nopagebreak
 
-\\putplen{{Part 1: \\ \\ Programmatic Table of Contents}}{{Overview of scientific program}}{{P:1}}
+\putplen{Part 1: \ \ Programmatic Table of Contents}{Overview of scientific program}{P:1}
 
-\\medskip\\nopagebreak
+\medskip\nopagebreak
 
-\\putplen{{Part 2: \\ \\ List of Participants}}{{Alphabetical list}}{{P:4}}
+\putplen{Part 2: \ \ List of Participants}{Alphabetical list}{P:4}
 
-\\putplen{{Part 3: \\ \\ Organizational Comments}}{{Comments, overview program, map}}{{P:5}}
+\putplen{Part 3: \ \ Organizational Comments}{Comments, overview program, map}{P:5}
 
-\\nopagebreak \\vfill
+\nopagebreak \vfill
 %% -- END PROGRAM -- %%
 
-{abstracts_block}
+${abstracts_block}
 
 %% -- PARTICIPANTS -- %%
-\\onecolumn \\cleardoublepage \\mbox{{}} \\vspace*{{6cm}}
-\\begin{{center}}
-\\Huge\\textbf{{Part 2\\\\[2ex] List of Participants}}
-\\end{{center}}
-\\hypertarget{{P:4}}{{}} \\label{{P:4}} \\twocolumn \\cleardoublepage
+\onecolumn \cleardoublepage \mbox{} \vspace*{6cm}
+\begin{center}
+\Huge\textbf{Part 2\\[2ex] List of Participants}
+\end{center}
+\hypertarget{P:4}{} \label{P:4} \twocolumn \cleardoublepage
 
-\\input{{participants}}
-\\nopagebreak \\vfill
+\input{participants}
+\nopagebreak \vfill
 
-\\newpage
+\newpage
 
 %% -- END OF PARTICIPANTS -- %%
 
-{comments_block}
+${comments_block}
 
-\\end{{document}}
-"""
+\end{document}
+""")
+
+
+def _gen_main(
+    lcfg: LaTeXConfig,
+    day_files: list[str],
+    *,
+    with_comments: bool = False,
+    with_abstracts: bool = False,
+) -> str:
+    """Generate main.tex (master document)."""
+    header_left = _esc(lcfg.header_left or f"{lcfg.edition} {lcfg.conference_title}")
+    header_right = _esc(lcfg.header_right)
+    pdf_title = f"{lcfg.document_title} {lcfg.edition} {lcfg.conference_title}"
+
+    col = lcfg.colors
+    daybox = col.get("daybox", "1,.2,.2")
+    plebox = col.get("plebox", ".4,0,.8")
+    sesbox = col.get("sesbox", ".8,.8,1")
+
+    comments_block = ""
+    if with_comments:
+        comments_block = (
+            "\n%% -- COMMENTS (general info + programme tables) -- %%\n"
+            "\\onecolumn\n"
+            "\\input{comments}\n"
+            "\\cleardoublepage \\mbox{} \\vspace*{6cm}\n"
+        )
+
+    abstracts_block = ""
+    if with_abstracts:
+        abstracts_block = (
+            "\n%% -- ABSTRACTS -- %%\n"
+            "\\onecolumn \\cleardoublepage \\mbox{} \\vspace*{6cm}\n"
+            "\\begin{center}\n"
+            "\\Huge\\textbf{Part 3\\\\[2ex] Abstracts}\n"
+            "\\end{center}\n"
+            "\\cleardoublepage\n"
+            "\\input{abstracts}\n"
+        )
+
+    return _MAIN_TEMPLATE.substitute(
+        daybox=daybox,
+        plebox=plebox,
+        sesbox=sesbox,
+        pdf_title=_esc(pdf_title),
+        conference_title=_esc(lcfg.conference_title),
+        header_left=header_left,
+        header_right=header_right,
+        comments_block=comments_block,
+        abstracts_block=abstracts_block,
+    )
 
 
 def _gen_program_tex(program: Program, lcfg: LaTeXConfig, day_file_map: dict[int, str]) -> str:
@@ -407,15 +450,17 @@ def _gen_program_tex(program: Program, lcfg: LaTeXConfig, day_file_map: dict[int
     Interleaves plenaries and \\input{dayN_period} in correct time order,
     matching the boa2023 style.
     """
-    lines: list[str] = []
+    buf = io.StringIO()
+    write = buf.write
+    # Hot-loop globals bound to locals
+    esc = _esc
+    non_session, PLENARY, SESSION = _NON_SESSION_KINDS, SlotKind.PLENARY, SlotKind.SESSION
 
     for day_prog in program.days:
         day_num = day_prog.day
         heading = lcfg.full_day_heading(day_num)
-        lines.append(f"\\dayheading{{{_esc(heading)}}}")
-        lines.append("")
-        lines.append("\\medskip\\nopagebreak")
-        lines.append("")
+        write(f"\\dayheading{{{esc(heading)}}}\n")
+        write(_MEDSKIP)
 
         # Group consecutive session slots into periods and interleave
         # with plenaries in correct time order
@@ -425,26 +470,24 @@ def _gen_program_tex(program: Program, lcfg: LaTeXConfig, day_file_map: dict[int
         for slot in day_prog.slots:
             ts: TimeSlot = slot["time_slot"]
 
-            if ts.kind in (SlotKind.BREAK, SlotKind.LUNCH, SlotKind.DINNER):
+            if ts.kind in non_session:
                 # Flush pending sessions before a break
                 if pending_sessions:
                     fname = f"day{day_num}_p{period_idx}"
                     if day_num in day_file_map:
                         fname = f"{day_file_map[day_num]}_p{period_idx}"
-                    lines.append(f"\\input{{{fname}}}")
-                    lines.append("")
+                    write(f"\\input{{{fname}}}\n\n")
                     pending_sessions = False
                     period_idx += 1
                 continue
 
-            if ts.kind == SlotKind.PLENARY:
+            if ts.kind == PLENARY:
                 # Flush pending sessions before a plenary
                 if pending_sessions:
                     fname = f"day{day_num}_p{period_idx}"
                     if day_num in day_file_map:
                         fname = f"{day_file_map[day_num]}_p{period_idx}"
-                    lines.append(f"\\input{{{fname}}}")
-                    lines.append("")
+                    write(f"\\input{{{fname}}}\n\n")
                     pending_sessions = False
                     period_idx += 1
 
@@ -454,25 +497,23 @@ def _gen_program_tex(program: Program, lcfg: LaTeXConfig, day_file_map: dict[int
                 room_name = ""
                 if sessions and hasattr(sessions[0], 'room') and sessions[0].room:
                     room_name = sessions[0].room.name
-                speaker = _esc(ts.speaker) if ts.speaker else ""
-                chair_str = f"{_esc(ts.chair)}" if ts.chair else ""
+                speaker = esc(ts.speaker) if ts.speaker else ""
+                chair_str = f"{esc(ts.chair)}" if ts.chair else ""
                 plenary_name = lcfg.extra.get("plenary_name", "Plenary")
                 label = ts.label or ""
                 trunc = lcfg.extra.get("truncate_plenary_title")
                 if trunc and isinstance(trunc, int) and len(label) > trunc:
                     label = label[:trunc] + "..."
-                lines.append(
-                    f"\\pleheading{{{_esc(plenary_name)}}}{{{_esc(room_name)}}}"
-                    f"{{{_esc(label)}}}{{{speaker}}}"
-                    f"{{{chair_str}}}{{{ts.start}--{ts.end}}}"
+                write(
+                    f"\\pleheading{{{esc(plenary_name)}}}{{{esc(room_name)}}}"
+                    f"{{{esc(label)}}}{{{speaker}}}"
+                    f"{{{chair_str}}}{{{ts.start}--{ts.end}}}\n"
                 )
-                lines.append("")
-                lines.append("\\medskip\\nopagebreak")
-                lines.append("")
+                write(_MEDSKIP)
                 continue
 
             # SESSION slot — mark as pending
-            if ts.kind == SlotKind.SESSION:
+            if ts.kind == SESSION:
                 pending_sessions = True
 
         # Flush any remaining sessions at end of day
@@ -480,135 +521,118 @@ def _gen_program_tex(program: Program, lcfg: LaTeXConfig, day_file_map: dict[int
             fname = f"day{day_num}_p{period_idx}"
             if day_num in day_file_map:
                 fname = f"{day_file_map[day_num]}_p{period_idx}"
-            lines.append(f"\\input{{{fname}}}")
-            lines.append("")
+            write(f"\\input{{{fname}}}\n\n")
 
-    return "\n".join(lines)
+    # Every block ends with a blank line; drop the file's final newline
+    return buf.getvalue()[:-1]
 
 
 def _gen_day_period_tex(
-    program: Program, day_num: int, period_idx: int, lcfg: LaTeXConfig
+    day_num: int,
+    period_idx: int,
+    slots: list[dict],
+    lcfg: LaTeXConfig,
+    topic_names: dict[str, str],
 ) -> str:
     """Generate a dayN_pM.tex file with sessions and talks for one period.
 
     A *period* is a contiguous block of SESSION slots between
-    plenaries/breaks/lunch within one day.
+    plenaries/breaks/lunch within one day; *slots* are that block as
+    returned by :func:`_session_periods`.  *topic_names* is the
+    programme-wide mapping from :func:`build_topic_display_names`.
     """
-    topic_names = build_topic_display_names(program)
-    lines: list[str] = []
-    lines.append(f"%% THIS IS THE PROGRAM DATA FOR DAY {day_num} PERIOD {period_idx}")
-    lines.append("%% AUTOMATICALLY GENERATED BY CPM")
-    lines.append("")
+    buf = io.StringIO()
+    write = buf.write
+    # Hot-loop globals bound to locals
+    esc, time_to_min, fmt_min = _esc, _time_to_min, _fmt_min
+    # Timing options are per-config, not per-session
+    exact_pres = lcfg.extra.get("exact_presentation_timing", False)
+    exact_sess = lcfg.extra.get("exact_session_timing", False)
+    cfg_pres_dur = lcfg.extra.get("presentation_duration_min", 20)
+    write(
+        f"%% THIS IS THE PROGRAM DATA FOR DAY {day_num} PERIOD {period_idx}\n"
+        "%% AUTOMATICALLY GENERATED BY CPM\n"
+        "\n"
+    )
 
-    day_prog = None
-    for dp in program.days:
-        if dp.day == day_num:
-            day_prog = dp
-            break
-    if day_prog is None:
-        return "\n".join(lines)
-
-    # Iterate and track period index
-    cur_period = 0
-    in_sessions = False
-    for slot in day_prog.slots:
+    for slot in slots:
         ts = slot["time_slot"]
-        sessions = slot["sessions"]
-
-        if ts.kind == SlotKind.SESSION:
-            if not in_sessions and cur_period > 0:
-                pass  # already advanced
-            in_sessions = True
+        for sess in slot["sessions"]:
+            room_name = sess.room_name
+            topic_name = topic_names.get(sess.session_id, sess.topic_name)
+            chair_name = sess.chair_name
+
+            if exact_pres:
+                pres_dur = cfg_pres_dur
+            else:
+                pres_dur = 20
+                try:
+                    if len(sess.papers) > 0 and ts.duration_minutes > 0:
+                        pres_dur = ts.duration_minutes // len(sess.papers)
+                except Exception:
+                    pass
+
+            base_min = time_to_min(ts.start)  # session start, shared by all talks
+
+            # Compute session time range
+            if exact_sess and sess.papers:
+                exact_end_min = base_min + len(sess.papers) * pres_dur
+                time_range = f"{ts.start}-{fmt_min(exact_end_min).replace('.', ':')}"
+            else:
+                time_range = f"{ts.start}-{ts.end}"
+
+            write(
+                f"\\sesheading{{{esc(sess.session_id)}}}{{{esc(room_name)}}}\n"
+                f"{{{esc(topic_name)}}}\n"
+                f"{{{esc(chair_name)}}}{{{time_range}}}\n"
+            )
+            write(_MEDSKIP)
 
-            if cur_period != period_idx:
+            if not sess.papers:
                 continue
 
-            for sess in sessions:
-                room_name = sess.room.name if sess.room else ""
-                topic_name = topic_names.get(sess.session_id, sess.topic.name if sess.topic else "")
-                chair_name = sess.chair.name if sess.chair else ""
-
-                exact_pres = lcfg.extra.get("exact_presentation_timing", False)
-                exact_sess = lcfg.extra.get("exact_session_timing", False)
-                cfg_pres_dur = lcfg.extra.get("presentation_duration_min", 20)
-
-                if exact_pres:
-                    pres_dur = cfg_pres_dur
-                else:
-                    pres_dur = 20
-                    try:
-                        if len(sess.papers) > 0 and ts.duration_minutes > 0:
-                            pres_dur = ts.duration_minutes // len(sess.papers)
-                    except Exception:
-                        pass
-
-                # Compute session time range
-                if exact_sess and sess.papers:
-                    exact_end_min = _time_to_min(ts.start) + len(sess.papers) * pres_dur
-                    time_range = f"{ts.start}-{_fmt_min(exact_end_min).replace('.', ':')}"
-                else:
-                    time_range = f"{ts.start}-{ts.end}"
-
-                lines.append(
-                    f"\\sesheading{{{_esc(sess.session_id)}}}{{{_esc(room_name)}}}"
+            for idx, paper in enumerate(sess.papers):
+                start_min = base_min + idx * pres_dur
+                end_min = start_min + pres_dur
+                talk_start = fmt_min(start_min)
+                talk_end = fmt_min(end_min)
+                talk_id = f"{sess.session_id}-{idx + 1}"
+
+                # Up to three (name, affiliation) pairs, escaped once each
+                esc_auth = [
+                    (esc(a.name), esc(a.affiliation) if a.affiliation else "")
+                    for a in paper.authors[:3]
+                ]
+                speaker = esc_auth[0][0] if esc_auth else ""  # first author presents
+                esc_auth += _NO_AUTHORS[len(esc_auth):]
+                (a1_name, a1_aff), (a2_name, a2_aff), (a3_name, a3_aff) = esc_auth
+
+                write(
+                    f"\\puttalk{{{esc(talk_id)}\\hfill {talk_start}-{talk_end}}}\n"
+                    f"{{{esc(paper.title)}}}\n"
+                    f"{{{a1_name}}}{{{a1_aff}}}\n"
+                    f"{{{a2_name}}}{{{a2_aff}}}\n"
+                    f"{{{a3_name}}}{{{a3_aff}}}\n"
+                    f"{{{speaker}}}\n"
+                    "\n"
                 )
-                lines.append(f"{{{_esc(topic_name)}}}")
-                lines.append(f"{{{_esc(chair_name)}}}{{{time_range}}}")
-                lines.append("")
-                lines.append("\\medskip\\nopagebreak")
-                lines.append("")
 
-                if not sess.papers:
-                    continue
+    return buf.getvalue()
 
-                for idx, paper in enumerate(sess.papers):
-                    start_min = _time_to_min(ts.start) + idx * pres_dur
-                    end_min = start_min + pres_dur
-                    talk_start = _fmt_min(start_min)
-                    talk_end = _fmt_min(end_min)
-                    talk_id = f"{sess.session_id}-{idx + 1}"
-
-                    authors = paper.authors
-                    a1_name = _esc(authors[0].name) if len(authors) > 0 else ""
-                    a1_aff = _esc(authors[0].affiliation) if len(authors) > 0 and authors[0].affiliation else ""
-                    a2_name = _esc(authors[1].name) if len(authors) > 1 else ""
-                    a2_aff = _esc(authors[1].affiliation) if len(authors) > 1 and authors[1].affiliation else ""
-                    a3_name = _esc(authors[2].name) if len(authors) > 2 else ""
-                    a3_aff = _esc(authors[2].affiliation) if len(authors) > 2 and authors[2].affiliation else ""
-                    speaker = _esc(authors[0].name) if len(authors) > 0 else ""
-
-                    lines.append(
-                        f"\\puttalk{{{_esc(talk_id)}\\hfill {talk_start}-{talk_end}}}"
-                    )
-                    lines.append(f"{{{_esc(paper.title)}}}")
-                    lines.append(f"{{{a1_name}}}{{{a1_aff}}}")
-                    lines.append(f"{{{a2_name}}}{{{a2_aff}}}")
-                    lines.append(f"{{{a3_name}}}{{{a3_aff}}}")
-                    lines.append(f"{{{speaker}}}")
-                    lines.append("")
 
-        else:
-            # Non-session: advance period counter if we were in sessions
-            if in_sessions:
-                cur_period += 1
-                in_sessions = False
-
-    lines.append("")
-    return "\n".join(lines)
-
-
-def _count_session_periods(day_prog) -> int:
-    """Count the number of contiguous session-slot groups in a day."""
-    count = 0
-    in_sessions = False
+def _session_periods(day_prog: DayProgram) -> list[list[dict]]:
+    """Split a day into periods: maximal runs of consecutive SESSION slots."""
+    periods: list[list[dict]] = []
+    current: list[dict] | None = None
     for slot in day_prog.slots:
         if slot["time_slot"].kind == SlotKind.SESSION:
-            if not in_sessions:
-                count += 1
-                in_sessions = True
+            if current is None:
+                current = []
+                periods.append(current)
+            current.append(slot)
         else:
-            in_sessions = False
-    return count
+            current = None
+    return periods
 
 
 def _gen_participants(papers: list) -> str:
@@ -684,27 +708,21 @@ def _gen_comments(program: Program, lcfg: LaTeXConfig) -> str:
     conf = f"{lcfg.edition} {lcfg.conference_title} {lcfg.conference_subtitle}"
     lines.append(r"\section*{Welcome}")
     lines.append("The Organizing Committee has the pleasure of welcoming you to the")
-    lines.append(f"\\emph{{{_esc(conf)}}}, at {_esc(lcfg.venue)}.")
-    lines.append("")
+    lines.append(f"\\emph{{{_esc(conf)}}}, at {_esc(lcfg.venue)}.\n")
     lines.append(r"\section*{Aim}")
     lines.append(f"The aim of the {_esc(lcfg.conference_title)} is to promote research activities")
-    lines.append("and to enhance cooperation between researchers in the field.")
-    lines.append("")
+    lines.append("and to enhance cooperation between researchers in the field.\n")
     lines.append(r"\section*{Directions for speakers}")
     lines.append("For a contributed lecture, the available time includes a few minutes for discussion")
     lines.append("and room changes. Please adhere to the indicated schedule.")
     lines.append("In each room LCD projectors are available, as well as HDMI cables.")
-    lines.append(r"{\em When using a projector, you have to provide a notebook yourself.}")
-    lines.append("")
+    lines.append(r"{\em When using a projector, you have to provide a notebook yourself.}" "\n")
     lines.append(r"\section*{Website}")
-    lines.append("% TODO: Add the conference website URL here.")
-    lines.append("")
-    lines.append("")
+    lines.append("% TODO: Add the conference website URL here.\n\n")
 
     # ── Auto-generated landscape programme tables ──
     lines.append(r"\setlength\minrowclearance{1pt}")
-    lines.append(r"\newcommand{\rr}{\raggedright}")
-    lines.append("")
+    lines.append(r"\newcommand{\rr}{\raggedright}" "\n")
 
     for dp in program.days:
         day_num = dp.day
@@ -799,7 +817,7 @@ def _gen_comments(program: Program, lcfg: LaTeXConfig) -> str:
                     rn = _esc(sess.room.name) if sess.room else ""
                     room_cells.append(rn)
                     sid_cells.append(_esc(sess.session_id))
-                    tn = _esc(topic_names.get(sess.session_id, sess.topic.name if sess.topic else ""))
+                    tn = _esc(topic_names.get(sess.session_id, sess.topic_name))
                     topic_cells.append(f"\\rr \\emph{{{tn}}}")
                 # Pad to n_cols
                 while len(room_cells) < n_cols:
@@ -864,21 +882,28 @@ def _gen_comments(program: Program, lcfg: LaTeXConfig) -> str:
         lines.append(r"\end{tabularx}")
         lines.append(r"\vfill")
         lines.append(r"\end{landscape}")
-        lines.append(r"\pagebreak")
-        lines.append("")
+        lines.append(r"\pagebreak" "\n")
 
     return "\n".join(lines)
 
 
+@lru_cache(maxsize=1024)
 def _time_to_min(t: str) -> int:
-    parts = t.replace(".", ":").split(":")
-    return int(parts[0]) * 60 + int(parts[1])
+    h, _, m = t.partition(":" if ":" in t else ".")
+    return int(h) * 60 + int(m[:2])
 
 
+@lru_cache(maxsize=2048)
 def _fmt_min(m: int) -> str:
     return f"{m // 60}.{m % 60:02d}"
 
 
+def _write(path: Path, text: str) -> None:
+    """Write *text* as UTF-8 through one large buffer (few write syscalls)."""
+    with open(path, "w", encoding="utf-8", buffering=1 << 18) as f:
+        f.write(text)
+
+
 # ---------------------------------------------------------------------------
 # Main entry point
 # ---------------------------------------------------------------------------
@@ -951,30 +976,34 @@ def generate_latex_folder(
         day_files.append(fname)
 
     # Write commands.tex
-    (out / "commands.tex").write_text(_gen_commands(), encoding="utf-8")
+    _write(out / "commands.tex", _gen_commands())
 
     # Write front.tex
-    (out / "front.tex").write_text(_gen_front(lcfg), encoding="utf-8")
+    _write(out / "front.tex", _gen_front(lcfg))
 
     # Write program.tex (interleaves plenaries and \input{day_period} files)
-    (out / "program.tex").write_text(
-        _gen_program_tex(program, lcfg, day_file_map), encoding="utf-8"
-    )
+    _write(out / "program.tex", _gen_program_tex(program, lcfg, day_file_map))
 
-    # Write per-period day files
-    for dp in program.days:
-        n_periods = _count_session_periods(dp)
-        for pi in range(n_periods):
-            fname = f"{day_file_map[dp.day]}_p{pi}"
-            (out / f"{fname}.tex").write_text(
-                _gen_day_period_tex(program, dp.day, pi, lcfg), encoding="utf-8"
-            )
+    # Write per-period day files.  The files are independent, so they are
+    # rendered and written on a small thread pool (writes release the GIL).
+    topic_names = build_topic_display_names(program)
+    period_jobs = [
+        (dp.day, pi, slots, out / f"{day_file_map[dp.day]}_p{pi}.tex")
+        for dp in program.days
+        for pi, slots in enumerate(_session_periods(dp))
+    ]
+
+    def _write_period(job: tuple[int, int, list[dict], Path]) -> None:
+        day_num, pi, slots, path = job
+        _write(path, _gen_day_period_tex(day_num, pi, slots, lcfg, topic_names))
+
+    if period_jobs:
+        with ThreadPoolExecutor(max_workers=min(8, len(period_jobs))) as pool:
+            list(pool.map(_write_period, period_jobs))
 
     # Write participants.tex
     if papers:
-        (out / "participants.tex").write_text(
-            _gen_participants(papers), encoding="utf-8"
-        )
+        _write(out / "participants.tex", _gen_participants(papers))
     else:
         # Fallback: extract authors from the programme itself
         all_papers = []
@@ -984,37 +1013,31 @@ def generate_latex_folder(
                     if hasattr(sess, 'papers'):
                         all_papers.extend(sess.papers)
         if all_papers:
-            (out / "participants.tex").write_text(
-                _gen_participants(all_papers), encoding="utf-8"
-            )
+            _write(out / "participants.tex", _gen_participants(all_papers))
         else:
-            (out / "participants.tex").write_text(
+            _write(
+                out / "participants.tex",
                 "%% Participant list — to be filled manually or by a separate script.\n",
-                encoding="utf-8",
             )
 
     # Resolve abstract PDF template from argument or latex_config.extra
     pdf_tpl = abstract_pdf_template or lcfg.extra.get("abstract_pdf_template")
 
     # Write comments.tex (general info + landscape programme tables)
-    (out / "comments.tex").write_text(
-        _gen_comments(program, lcfg), encoding="utf-8"
-    )
+    _write(out / "comments.tex", _gen_comments(program, lcfg))
 
     # Write abstracts.tex (if a PDF template is provided)
     if pdf_tpl:
-        (out / "abstracts.tex").write_text(
-            _gen_abstracts(program, pdf_tpl), encoding="utf-8"
-        )
+        _write(out / "abstracts.tex", _gen_abstracts(program, pdf_tpl))
 
     # Write main.tex
-    (out / "main.tex").write_text(
+    _write(
+        out / "main.tex",
         _gen_main(
             lcfg, day_files,
             with_comments=True,
             with_abstracts=bool(pdf_tpl),
         ),
-        encoding="utf-8",
     )
 
     # Copy logo if specified — search in config dir, base dir, and data dir
@@ -122,7 +122,7 @@ def _build_presentations(
                 dur_min = ts.duration_minutes
                 room_name = ""
                 if sessions:
-                    room_name = sessions[0].room.name if sessions[0].room else ""
+                    room_name = sessions[0].room_name
                 presentations.append({
                     "ID": str(pres_id),
                     "Abstract ID": str(pres_id),
@@ -156,9 +156,9 @@ def _build_presentations(
             for sess in sessions:
                 session_counter += 1
                 sess_id_str = str(session_counter)
-                room_name = sess.room.name if sess.room else ""
-                chair_name = sess.chair.name if sess.chair else ""
-                topic_name = topic_names.get(sess.session_id, sess.topic.name if sess.topic else "")
+                room_name = sess.room_name
+                chair_name = sess.chair_name
+                topic_name = topic_names.get(sess.session_id, sess.topic_name)
                 sess_label = sess.label or topic_name or sess.session_id
 
                 if not sess.papers:
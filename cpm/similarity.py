@@ -2,76 +2,643 @@
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
 import json
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 import numpy as np
 
 from .models import Paper, Topic
 
+logger = logging.getLogger(__name__)
 
-def _get_model(model_name: str = "all-MiniLM-L6-v2"):
-    """Lazy-load a SentenceTransformer model."""
+# Default location of the on-disk embedding cache (one sub-folder per model)
+DEFAULT_CACHE_DIR = Path(".cache") / "sbert"
+
+# Inference backends selectable through the CPM_SBERT_BACKEND env variable
+_BACKENDS = ("torch", "onnx", "onnx-int8")
+
+# File written by export_dynamic_quantized_onnx_model for the VNNI config
+_ONNX_INT8_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+
+def _backend() -> str:
+    """Return the SBERT inference backend chosen via ``CPM_SBERT_BACKEND``."""
+    backend = os.environ.get("CPM_SBERT_BACKEND", "torch").strip().lower() or "torch"
+    if backend not in _BACKENDS:
+        raise ValueError(
+            f"Unknown CPM_SBERT_BACKEND {backend!r}; expected one of {', '.join(_BACKENDS)}"
+        )
+    return backend
+
+
+def _set_torch_threads(threads: int) -> None:
+    """Pin torch's intra-op pool to *threads* and its inter-op pool to 1."""
+    import torch
+
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Only allowed once, before any parallel work has started
+        pass
+
+
+# Serialises model loading: lru_cache alone would let two threads that miss
+# at the same time both load the model
+_MODEL_LOCK = threading.Lock()
+
+# Serialises encoding within a process: a loaded model (and its fast
+# tokenizer) must not be used from two threads at once, and each encode
+# already uses every core.  Re-entrant because _topic_embeddings holds it
+# across its cache lookup and the encode that fills it.
+_ENCODE_LOCK = threading.RLock()
+
+
+def _get_model(model_name: str = "all-MiniLM-L6-v2", threads: Optional[int] = None):
+    """Lazy-load a SentenceTransformer model, once per process.
+
+    Loaded models are memoized per (name, backend, threads), so the
+    paper-topic and topic-topic computations of one run share a single
+    instance.  See :func:`_load_model` for the backends.
+    """
+    with _MODEL_LOCK:
+        return _load_model(model_name, _backend(), threads or os.cpu_count() or 1)
+
+
+@lru_cache(maxsize=4)
+def _load_model(model_name: str, backend: str, threads: int):
+    """Load *model_name* for *backend*.
+
+    The torch backend runs on *threads* CPU threads.
+
+    ``CPM_SBERT_BACKEND=onnx`` runs the model through ONNX Runtime and
+    ``onnx-int8`` additionally applies dynamic int8 quantization; the
+    quantized export is done once and kept under ``.cache/onnx/``.  Both
+    need ``sentence-transformers>=3.2`` with its ``onnx`` extra.
+    """
     from sentence_transformers import SentenceTransformer
-    return SentenceTransformer(model_name)
+
+    if backend == "torch":
+        _set_torch_threads(threads)
+        return SentenceTransformer(model_name)
+    if backend == "onnx":
+        return SentenceTransformer(model_name, backend="onnx")
+
+    export_dir = DEFAULT_CACHE_DIR.parent / "onnx" / model_name.replace("/", "--")
+    if not (export_dir / _ONNX_INT8_FILE).exists():
+        from sentence_transformers import export_dynamic_quantized_onnx_model
+        model = SentenceTransformer(model_name, backend="onnx")
+        model.save(str(export_dir))
+        export_dynamic_quantized_onnx_model(
+            model, quantization_config="avx512_vnni", model_name_or_path=str(export_dir),
+        )
+    return SentenceTransformer(
+        str(export_dir), backend="onnx", model_kwargs={"file_name": _ONNX_INT8_FILE},
+    )
+
+
+# Sentences per forward pass in model.encode
+DEFAULT_BATCH_SIZE = 64
+
+# Encode in several worker processes once this many texts miss the cache
+_PARALLEL_MIN_TEXTS = 2000
+_MAX_ENCODE_WORKERS = 4
+
+# Texts handed to model.encode per call; bounds the activation peak
+_ENCODE_CHUNK = 512
+
+
+def _inference_context(bf16: bool = False):
+    """Context for SBERT forward passes: no autograd, optionally bfloat16.
+
+    Under the torch backend this enters ``torch.inference_mode()`` and, with
+    *bf16*, CPU autocast to bfloat16 (a large win on AVX-512-BF16/AMX CPUs,
+    scores typically within 1e-3 of float32).  The ONNX backends run outside
+    torch, so they get a no-op context.
+    """
+    stack = contextlib.ExitStack()
+    if _backend() != "torch":
+        return stack
+    import torch
+
+    stack.enter_context(torch.inference_mode())
+    if bf16:
+        stack.enter_context(torch.autocast("cpu", dtype=torch.bfloat16))
+    return stack
+
+
+def _encode_chunked(
+    model,
+    texts: list[str],
+    batch_size: int,
+    chunk: int = _ENCODE_CHUNK,
+    show_progress_bar: bool = False,
+    bf16: bool = False,
+) -> np.ndarray:
+    """Encode *texts* *chunk* at a time into one preallocated array.
+
+    Each ``model.encode`` call sees at most *chunk* texts, so the forward
+    pass activations are released between chunks and peak memory does not
+    grow with the number of papers.  The progress bar is only shown when
+    everything fits in one chunk; longer runs log per-chunk progress.
+    Encoding runs under :func:`_inference_context`, and the model
+    L2-normalises the embeddings itself, so cosine similarity reduces to
+    a dot product downstream.
+    """
+    with _inference_context(bf16):
+        if len(texts) <= chunk:
+            return np.asarray(model.encode(
+                texts, batch_size=batch_size, convert_to_numpy=True,
+                normalize_embeddings=True, show_progress_bar=show_progress_bar,
+            ), dtype=np.float32)
+        out: Optional[np.ndarray] = None
+        for start in range(0, len(texts), chunk):
+            part = model.encode(
+                texts[start:start + chunk], batch_size=batch_size, convert_to_numpy=True,
+                normalize_embeddings=True, show_progress_bar=False,
+            )
+            if out is None:
+                out = np.empty((len(texts), part.shape[1]), dtype=np.float32)
+            out[start:start + len(part)] = part
+            logger.info("Encoded %d/%d texts", min(start + chunk, len(texts)), len(texts))
+    return out
+
+
+def _encode_shard(
+    texts: list[str], model_name: str, batch_size: int, threads: int, bf16: bool,
+) -> np.ndarray:
+    """Worker-process entry point: encode one shard of *texts*."""
+    model = _get_model(model_name, threads=threads)
+    return _encode_chunked(model, texts, batch_size, bf16=bf16)
+
+
+def _encode(
+    texts: list[str],
+    model_name: str,
+    batch_size: int,
+    model=None,
+    bf16: bool = False,
+    progress: bool = False,
+) -> np.ndarray:
+    """Encode *texts*, sharding across worker processes for large inputs.
+
+    Calls are serialised by ``_ENCODE_LOCK``.  A caller-supplied *model*
+    is always used in-process.  Otherwise, below
+    ``_PARALLEL_MIN_TEXTS`` texts (or on a single core) the model is
+    loaded in-process; above it each of up to ``_MAX_ENCODE_WORKERS``
+    processes loads the model once, encodes a contiguous shard with its
+    share of the CPU threads, and the shards are concatenated in order.
+    """
+    with _ENCODE_LOCK:
+        return _encode_locked(texts, model_name, batch_size, model, bf16, progress)
+
+
+def _encode_locked(
+    texts: list[str],
+    model_name: str,
+    batch_size: int,
+    model,
+    bf16: bool,
+    progress: bool,
+) -> np.ndarray:
+    """:func:`_encode` body; the caller holds ``_ENCODE_LOCK``."""
+    if model is not None:
+        return _encode_chunked(
+            model, texts, batch_size, show_progress_bar=progress, bf16=bf16,
+        )
+    cpus = os.cpu_count() or 1
+    workers = min(_MAX_ENCODE_WORKERS, cpus, len(texts) // (_PARALLEL_MIN_TEXTS // 2))
+    if len(texts) <= _PARALLEL_MIN_TEXTS or workers < 2:
+        model = _get_model(model_name)
+        return _encode_chunked(
+            model, texts, batch_size, show_progress_bar=progress, bf16=bf16,
+        )
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    step = -(-len(texts) // workers)
+    shards = [texts[i:i + step] for i in range(0, len(texts), step)]
+    threads = max(1, cpus // len(shards))
+    # spawn: forked children would inherit torch's already-started thread pools
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(shards), mp_context=ctx) as pool:
+        parts = list(pool.map(
+            _encode_shard,
+            shards,
+            [model_name] * len(shards),
+            [batch_size] * len(shards),
+            [threads] * len(shards),
+            [bf16] * len(shards),
+        ))
+    return np.concatenate(parts)
+
+
+def _encode_cached(
+    texts: list[str],
+    model_name: str,
+    cache_dir: str | Path | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    model=None,
+    bf16: bool = False,
+    progress: bool = False,
+) -> np.ndarray:
+    """Encode *texts* with SBERT, reusing embeddings cached on disk.
+
+    Byte-identical texts are encoded only once and scattered back.  With
+    a *cache_dir* (the CLI uses ``DEFAULT_CACHE_DIR``), each embedding is
+    stored as ``{cache_dir}/{model_name}/{sha256}.npy`` in float32, so
+    cached and fresh vectors are identical.  Only cache misses are sent to
+    the model, in a single batch, and the model itself (unless passed as
+    *model*) is loaded only when there is at least one miss.  The default
+    ``cache_dir=None`` disables the cache.
+
+    ``SentenceTransformer.encode`` already sorts its input by length before
+    batching, so each batch of *batch_size* texts pads to similar lengths.
+
+    Returns:
+        (len(texts), dim) float32 array.
+    """
+    index: dict[str, int] = {}
+    inverse = [index.setdefault(t, len(index)) for t in texts]
+    unique = list(index)
+
+    if cache_dir is None:
+        return _encode(unique, model_name, batch_size, model, bf16, progress)[inverse]
+
+    # Quantized backends and bf16 give slightly different vectors; keep
+    # them apart
+    folder = Path(cache_dir) / model_name.replace("/", "--")
+    backend = _backend()
+    if backend != "torch":
+        folder = folder.with_name(f"{folder.name}@{backend}")
+    elif bf16:
+        folder = folder.with_name(f"{folder.name}@bf16")
+    keys = [hashlib.sha256(t.encode("utf-8")).hexdigest() for t in unique]
+    rows: list[Optional[np.ndarray]] = [None] * len(unique)
+    missing: list[int] = []
+    for i, key in enumerate(keys):
+        f = folder / f"{key}.npy"
+        emb = np.load(f) if f.exists() else None
+        # Entries written before the cache switched to float32 are redone
+        if emb is not None and emb.dtype == np.float32:
+            rows[i] = emb
+        else:
+            missing.append(i)
+
+    if missing:
+        embs = _encode(
+            [unique[i] for i in missing], model_name, batch_size, model, bf16, progress,
+        ).astype(np.float32, copy=False)
+        folder.mkdir(parents=True, exist_ok=True)
+        for i, emb in zip(missing, embs):
+            f = folder / f"{keys[i]}.npy"
+            tmp = f.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+            with open(tmp, "wb") as fh:
+                np.save(fh, emb)
+            os.replace(tmp, f)
+            rows[i] = emb
+
+    if not rows:
+        return np.zeros((0, 0), dtype=np.float32)
+    return np.stack(rows)[inverse]
+
+
+# Topic-name embeddings already computed in this process, keyed by
+# (model_name, backend, bf16, disk cache on/off, topic names in order)
+_TOPIC_EMB_CACHE: dict[tuple, np.ndarray] = {}
+
+
+def _topic_embeddings(
+    names: list[str],
+    model_name: str,
+    cache_dir: str | Path | None,
+    batch_size: int,
+    model=None,
+    bf16: bool = False,
+    progress: bool = False,
+) -> np.ndarray:
+    """Embeddings of the topic *names*, memoized in-process.
+
+    The topic list rarely changes between the paper-topic and topic-topic
+    computations (or between calls from a long-lived process), so its
+    embeddings are reused without even touching the disk cache.  The
+    lookup and the encode that fills it run under ``_ENCODE_LOCK``, so two
+    threads asking for the same topics encode them once.  A copy is
+    returned because callers normalise in place.
+    """
+    key = (model_name, _backend(), bf16, cache_dir is None, tuple(names))
+    with _ENCODE_LOCK:
+        embs = _TOPIC_EMB_CACHE.get(key)
+        if embs is None:
+            embs = _encode_cached(
+                names, model_name, cache_dir, batch_size, model, bf16, progress,
+            )
+            _TOPIC_EMB_CACHE[key] = embs
+    return embs.copy()
+
+
+def _normalize_rows(embs: np.ndarray) -> np.ndarray:
+    """Scale each row of *embs* to unit length, in place where possible.
+
+    Fresh embeddings already come out normalised (see
+    :func:`_encode_chunked`); this covers caller-supplied embeddings, which
+    need not be.
+
+    Returns a C-contiguous float32 array (the input itself when it already
+    is one).
+    """
+    embs = np.ascontiguousarray(embs, dtype=np.float32)
+    norms = np.sqrt(np.einsum("ij,ij->i", embs, embs))[:, None]
+    np.divide(embs, norms, out=embs)
+    return embs
+
+
+@lru_cache(maxsize=None)
+def _simsimd():
+    """Return the optional ``simsimd`` module, or None when not installed."""
+    try:
+        import simsimd
+    except ImportError:
+        return None
+    return simsimd
+
+
+@lru_cache(maxsize=None)
+def _scipy_ssyrk():
+    """Return SciPy's BLAS ``ssyrk``, or None when SciPy is not installed."""
+    try:
+        from scipy.linalg.blas import ssyrk
+    except ImportError:
+        return None
+    return ssyrk
+
+
+def _cosine(
+    a: np.ndarray,
+    b: Optional[np.ndarray],
+    precision: Literal["f32", "f16"] = "f32",
+) -> np.ndarray:
+    """Cosine similarity between the rows of *a* and *b* as a float32 matrix.
+
+    ``b=None`` compares *a* with itself; with SciPy installed that product
+    uses BLAS ``ssyrk``, which computes only one triangle.
+
+    Uses SimSIMD's ``cdist`` when the optional ``simsimd`` package is
+    installed, and NumPy otherwise.  ``precision="f16"`` rounds the inputs
+    to float16 for SimSIMD's half-precision kernel and raises ValueError
+    without SimSIMD: NumPy has no half-precision GEMM, and casting to
+    float16 only to accumulate in float32 is slower than float32 and less
+    accurate.
+    """
+    if precision not in ("f32", "f16"):
+        raise ValueError(f"precision must be 'f32' or 'f16', got {precision!r}")
+    simd = _simsimd()
+    if simd is None and precision == "f16":
+        raise ValueError("precision='f16' needs the optional simsimd package")
+    if simd is not None:
+        # One SIMD kernel computes the distances, norms included
+        dtype = np.float16 if precision == "f16" else np.float32
+        a = np.ascontiguousarray(a, dtype=dtype)
+        b = a if b is None else np.ascontiguousarray(b, dtype=dtype)
+        dist = np.asarray(simd.cdist(a, b, metric="cosine"), dtype=np.float32)
+        return np.subtract(1.0, dist, out=dist)
+    a = _normalize_rows(a)
+    if b is None:
+        syrk = _scipy_ssyrk()
+        if syrk is not None:
+            # Symmetric rank-k update fills one triangle only; mirror it.
+            # a.T is Fortran-ordered, so trans=1 avoids a copy.
+            sim = syrk(1.0, a.T, trans=1)
+            lower = np.tril_indices(len(a), -1)
+            sim[lower] = sim.T[lower]
+            return np.ascontiguousarray(sim)
+    b = a if b is None else _normalize_rows(b)
+    return a @ b.T
+
+
+@lru_cache(maxsize=None)
+def _orjson():
+    """Return the optional ``orjson`` module, or None when not installed."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _write_json(path: str | Path, obj) -> None:
+    """Write *obj* as 2-space indented JSON, through orjson when available."""
+    oj = _orjson()
+    if oj is not None:
+        Path(path).write_bytes(oj.dumps(obj, option=oj.OPT_INDENT_2))
+    else:
+        Path(path).write_text(json.dumps(obj, indent=2))
+
+
+def _read_json(path: str | Path):
+    """Parse the JSON file at *path*, through orjson when available."""
+    oj = _orjson()
+    if oj is not None:
+        return oj.loads(Path(path).read_bytes())
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def _is_npz_path(path: str | Path) -> bool:
+    """True when *path* should be written as an ``.npz`` archive."""
+    return Path(path).suffix.lower() == ".npz"
+
+
+def _is_npz_file(path: str | Path) -> bool:
+    """True when the file at *path* is a zip (``.npz``) archive."""
+    with open(path, "rb") as f:
+        return f.read(4) == b"PK\x03\x04"
 
 
 # ---------------------------------------------------------------------------
 # Paper ↔ Topic similarity
 # ---------------------------------------------------------------------------
 
+@dataclass(eq=False)
+class PaperTopicScores:
+    """Paper ↔ topic similarity scores as one dense matrix.
+
+    ``matrix[i, j]`` is the score of paper ``paper_ids[i]`` for topic
+    ``topic_ids[j]``.  Lookups by id go through index maps built once.
+    """
+
+    paper_ids: np.ndarray
+    topic_ids: np.ndarray
+    matrix: np.ndarray
+    _paper_index: dict[int, int] = field(init=False, repr=False)
+    _topic_index: dict[int, int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.paper_ids = np.asarray(self.paper_ids, dtype=np.int64)
+        self.topic_ids = np.asarray(self.topic_ids, dtype=np.int64)
+        self._paper_index = {pid: i for i, pid in enumerate(self.paper_ids.tolist())}
+        self._topic_index = {tid: j for j, tid in enumerate(self.topic_ids.tolist())}
+
+    def __len__(self) -> int:
+        return len(self._paper_index)
+
+    def __contains__(self, paper_id: object) -> bool:
+        return paper_id in self._paper_index
+
+    def get(self, paper_id: int, topic_id: int, default: float = 0.0) -> float:
+        """Score of *paper_id* for *topic_id*, or *default* if either is unknown."""
+        i = self._paper_index.get(paper_id)
+        j = self._topic_index.get(topic_id)
+        if i is None or j is None:
+            return default
+        return float(self.matrix[i, j])
+
+    def best(self, paper_id: int, topic_ids: list[int]) -> float:
+        """Highest score of *paper_id* over *topic_ids* (0.0 if none known)."""
+        row = self.matrix[self._paper_index[paper_id]]
+        tindex = self._topic_index
+        return max(
+            (float(row[tindex[tid]]) if tid in tindex else 0.0 for tid in topic_ids),
+            default=0.0,
+        )
+
+    def to_dict(self) -> dict[int, dict[int, float]]:
+        """Nested ``{paper_id: {topic_id: score}}`` view (built on demand)."""
+        tids = self.topic_ids.tolist()
+        return {
+            pid: dict(zip(tids, row))
+            for pid, row in zip(self.paper_ids.tolist(), self.matrix.tolist())
+        }
+
+    @classmethod
+    def from_dict(cls, scores: dict[int, dict[int, float]]) -> PaperTopicScores:
+        """Build from a nested dict; missing pairs score 0.0."""
+        tindex: dict[int, int] = {}
+        for tscores in scores.values():
+            for tid in tscores:
+                tindex.setdefault(tid, len(tindex))
+        matrix = np.zeros((len(scores), len(tindex)), dtype=np.float64)
+        for i, tscores in enumerate(scores.values()):
+            for tid, s in tscores.items():
+                matrix[i, tindex[tid]] = s
+        return cls(list(scores), list(tindex), matrix)
+
+
 def compute_paper_topic_scores(
     papers: list[Paper],
     topics: list[Topic],
     model_name: str = "all-MiniLM-L6-v2",
-) -> dict[int, dict[int, float]]:
+    cache_dir: str | Path | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    precision: Literal["f32", "f16"] = "f32",
+    model=None,
+    bf16: bool = False,
+    show_progress_bar: Optional[bool] = None,
+    paper_embeddings: Optional[np.ndarray] = None,
+    topic_embeddings: Optional[np.ndarray] = None,
+) -> PaperTopicScores:
     """Compute cosine similarity between each paper title and each topic name.
 
-    Returns:
-        {paper_id: {topic_id: score, ...}, ...}
-    """
-    model = _get_model(model_name)
+    Embeddings are cached under *cache_dir*, if given (see
+    :func:`_encode_cached`); *precision* selects the width of the
+    similarity product (see :func:`_cosine`).  An already loaded SentenceTransformer may be passed
+    as *model*; otherwise one is loaded (once per process) on a cache miss.
+    *bf16* runs the encoder under bfloat16 autocast (see
+    :func:`_inference_context`).  The tqdm progress bar is off unless
+    *show_progress_bar* is set or this module logs at DEBUG level.
 
-    paper_texts = [p.title for p in papers]
-    topic_texts = [t.name for t in topics]
+    Pre-encoded *paper_embeddings* / *topic_embeddings* (one row per paper
+    / topic, in order) are used as given; when both are supplied the model
+    is never touched.
 
-    paper_embs = model.encode(paper_texts, convert_to_numpy=True, show_progress_bar=True)
-    topic_embs = model.encode(topic_texts, convert_to_numpy=True, show_progress_bar=True)
+    Returns:
+        PaperTopicScores with one row per paper and one column per topic.
+    """
+    if show_progress_bar is None:
+        show_progress_bar = logger.isEnabledFor(logging.DEBUG)
+    # Caller arrays are copied: _cosine normalises its inputs in place
+    if paper_embeddings is not None:
+        paper_embs = np.array(paper_embeddings, dtype=np.float32)
+    else:
+        paper_embs = _encode_cached(
+            [p.title for p in papers], model_name, cache_dir, batch_size, model, bf16,
+            show_progress_bar,
+        )
+    if topic_embeddings is not None:
+        topic_embs = np.array(topic_embeddings, dtype=np.float32)
+    else:
+        topic_embs = _topic_embeddings(
+            [t.name for t in topics], model_name, cache_dir, batch_size, model, bf16,
+            show_progress_bar,
+        )
+
+    sim_matrix = _cosine(paper_embs, topic_embs, precision)  # (n_papers, n_topics)
+    return PaperTopicScores(
+        [p.paper_id for p in papers], [t.topic_id for t in topics], sim_matrix,
+    )
 
-    # Normalise for cosine similarity
-    paper_embs = paper_embs / np.linalg.norm(paper_embs, axis=1, keepdims=True)
-    topic_embs = topic_embs / np.linalg.norm(topic_embs, axis=1, keepdims=True)
 
-    sim_matrix = paper_embs @ topic_embs.T  # (n_papers, n_topics)
+def save_paper_topic_scores(
+    scores: PaperTopicScores | dict[int, dict[int, float]],
+    path: str | Path,
+    variant: Optional[str] = None,
+) -> None:
+    """Save paper-topic scores to *path*.
 
-    scores: dict[int, dict[int, float]] = {}
-    for i, paper in enumerate(papers):
-        scores[paper.paper_id] = {
-            topic.topic_id: float(sim_matrix[i, j])
-            for j, topic in enumerate(topics)
+    A ``.npz`` suffix writes a compressed NumPy archive (``paper_ids``,
+    ``topic_ids``, float32 ``matrix``); any other suffix writes the legacy
+    JSON format.  An optional *variant* string describing how the scores
+    were computed is stored in the archive (see :func:`load_saved_variant`);
+    JSON files do not record it.
+    """
+    if _is_npz_path(path):
+        if isinstance(scores, dict):
+            scores = PaperTopicScores.from_dict(scores)
+        extra = {} if variant is None else {"variant": np.asarray(variant)}
+        np.savez_compressed(
+            path,
+            paper_ids=scores.paper_ids,
+            topic_ids=scores.topic_ids,
+            matrix=np.asarray(scores.matrix, dtype=np.float32),
+            **extra,
+        )
+        return
+    # Convert keys to strings for JSON; each row is zipped against the
+    # topic keys, stringified once
+    if isinstance(scores, PaperTopicScores):
+        tkeys = [str(tid) for tid in scores.topic_ids.tolist()]
+        out = {
+            str(pid): dict(zip(tkeys, [round(s, 6) for s in row]))
+            for pid, row in zip(scores.paper_ids.tolist(), scores.matrix.tolist())
         }
-    return scores
+    else:
+        out = {str(pid): {str(tid): round(s, 6) for tid, s in tscores.items()}
+               for pid, tscores in scores.items()}
+    _write_json(path, out)
 
 
-def save_paper_topic_scores(
-    scores: dict[int, dict[int, float]],
-    path: str | Path,
-) -> None:
-    """Save paper-topic scores to JSON."""
-    # Convert keys to strings for JSON
-    out = {str(pid): {str(tid): round(s, 6) for tid, s in tscores.items()}
-           for pid, tscores in scores.items()}
-    Path(path).write_text(json.dumps(out, indent=2))
-
-
-def load_paper_topic_scores(path: str | Path) -> dict[int, dict[int, float]]:
-    """Load paper-topic scores from JSON."""
-    raw = json.loads(Path(path).read_text())
-    return {
-        int(pid): {int(tid): float(s) for tid, s in tscores.items()}
+def load_paper_topic_scores(path: str | Path) -> PaperTopicScores:
+    """Load paper-topic scores saved by :func:`save_paper_topic_scores`.
+
+    The format (``.npz`` archive or JSON) is detected from the file content.
+    """
+    if _is_npz_file(path):
+        with np.load(path, allow_pickle=False) as z:
+            return PaperTopicScores(z["paper_ids"], z["topic_ids"], z["matrix"])
+    raw = _read_json(path)
+    return PaperTopicScores.from_dict({
+        int(pid): dict(zip(map(int, tscores), map(float, tscores.values())))
         for pid, tscores in raw.items()
-    }
+    })
 
 
 # ---------------------------------------------------------------------------
@@ -81,55 +648,266 @@ def load_paper_topic_scores(path: str | Path) -> dict[int, dict[int, float]]:
 def compute_topic_similarity_matrix(
     topics: list[Topic],
     model_name: str = "all-MiniLM-L6-v2",
+    cache_dir: str | Path | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    precision: Literal["f32", "f16"] = "f32",
+    model=None,
+    bf16: bool = False,
+    show_progress_bar: Optional[bool] = None,
+    embeddings: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """Compute the topic-topic cosine similarity matrix.
 
+    Embeddings are cached under *cache_dir*, if given (see
+    :func:`_encode_cached`); *precision* selects the width of the
+    similarity product (see :func:`_cosine`).  An already loaded SentenceTransformer may be passed
+    as *model*; otherwise one is loaded (once per process) on a cache miss.
+    *bf16* runs the encoder under bfloat16 autocast (see
+    :func:`_inference_context`).  The tqdm progress bar is off unless
+    *show_progress_bar* is set or this module logs at DEBUG level.
+    Pre-encoded topic *embeddings* skip the encoder entirely.
+
     Returns:
         (n_topics, n_topics) numpy array.
     """
-    model = _get_model(model_name)
-    texts = [t.name for t in topics]
-    embs = model.encode(texts, convert_to_numpy=True, show_progress_bar=True)
-    embs = embs / np.linalg.norm(embs, axis=1, keepdims=True)
-    return embs @ embs.T
+    if embeddings is not None:
+        return _cosine(np.array(embeddings, dtype=np.float32), None, precision)
+    if show_progress_bar is None:
+        show_progress_bar = logger.isEnabledFor(logging.DEBUG)
+    embs = _topic_embeddings(
+        [t.name for t in topics], model_name, cache_dir, batch_size, model, bf16,
+        show_progress_bar,
+    )
+    return _cosine(embs, None, precision)
+
+
+# Word tokens as matched by scikit-learn's TfidfVectorizer default pattern
+_TFIDF_TOKEN_RE = re.compile(r"(?u)\b\w\w+\b")
+
+# Below this many topics, topic_sim_backend="auto" picks TF-IDF over SBERT
+TFIDF_MAX_TOPICS = 30
+
+
+def compute_topic_similarity_tfidf(topics: list[Topic]) -> np.ndarray:
+    """Topic-topic cosine similarity of TF-IDF vectors of the topic names.
+
+    A model-free alternative to :func:`compute_topic_similarity_matrix` for
+    small topic lists, where loading the SBERT model costs more than the
+    whole computation.  Weighting follows scikit-learn's ``TfidfVectorizer``
+    defaults: lower-cased word tokens of two or more characters, raw term
+    counts, smoothed idf and L2-normalised rows.  Scores are lexical, so
+    they are typically lower than SBERT's for related but differently
+    worded topics.
+
+    Returns:
+        (n_topics, n_topics) float32 array.
+    """
+    docs = [_TFIDF_TOKEN_RE.findall(t.name.lower()) for t in topics]
+    vocab: dict[str, int] = {}
+    for doc in docs:
+        for word in doc:
+            vocab.setdefault(word, len(vocab))
+    tf = np.zeros((len(docs), len(vocab)), dtype=np.float64)
+    for i, doc in enumerate(docs):
+        for word in doc:
+            tf[i, vocab[word]] += 1
+    df = np.count_nonzero(tf, axis=0)
+    x = tf * (np.log((1 + len(docs)) / (1 + df)) + 1)
+    norms = np.linalg.norm(x, axis=1, keepdims=True)
+    np.divide(x, norms, out=x, where=norms > 0)
+    return (x @ x.T).astype(np.float32)
 
 
 def save_topic_similarity_matrix(
     matrix: np.ndarray,
     topics: list[Topic],
     path: str | Path,
+    variant: Optional[str] = None,
 ) -> None:
-    """Save the topic similarity matrix to JSON with topic metadata."""
+    """Save the topic similarity matrix with topic metadata.
+
+    A ``.npz`` suffix writes a NumPy archive; any other suffix writes the
+    legacy JSON format.  The archive is left uncompressed so that
+    :func:`load_topic_similarity_matrix` can memory-map the matrix.  As
+    with :func:`save_paper_topic_scores`, only the archive records the
+    optional *variant*.
+    """
     topic_ids = [t.topic_id for t in topics]
     topic_names = [t.name for t in topics]
+    if _is_npz_path(path):
+        extra = {} if variant is None else {"variant": np.asarray(variant)}
+        _savez_topic_matrix(
+            path, topic_ids, topic_names, np.asarray(matrix, dtype=np.float32), **extra,
+        )
+        return
     out = {
         "topic_ids": topic_ids,
         "topic_names": topic_names,
         "matrix": matrix.tolist(),
     }
-    Path(path).write_text(json.dumps(out, indent=2))
+    _write_json(path, out)
+
+
+def _savez_topic_matrix(path, topic_ids, topic_names, matrix, **extra) -> None:
+    """Write the uncompressed ``.npz`` layout of a topic similarity matrix.
+
+    *extra* arrays (e.g. ``variant``) are stored as additional members.
+    """
+    np.savez(
+        path,
+        topic_ids=np.asarray(topic_ids, dtype=np.int64),
+        topic_names=np.asarray(topic_names, dtype=str),
+        matrix=np.asarray(matrix),
+        **extra,
+    )
+
+
+def load_saved_variant(path: str | Path) -> Optional[str]:
+    """Return the *variant* recorded in a saved ``.npz`` result, if any.
+
+    None for JSON files, archives saved without a variant, and missing or
+    unreadable files.
+    """
+    try:
+        if not _is_npz_file(path):
+            return None
+        with np.load(path, allow_pickle=False) as z:
+            return str(z["variant"]) if "variant" in z.files else None
+    except Exception:  # unreadable archive: nothing recorded
+        return None
+
+
+def _npz_memmap(path: str | Path, name: str) -> Optional[np.memmap]:
+    """Memory-map array *name* of an ``.npz`` archive, read-only.
+
+    ``np.load`` ignores ``mmap_mode`` for archives, but a member stored
+    without compression is a plain ``.npy`` at a fixed offset in the file.
+    Returns None when the member is compressed (or missing).
+    """
+    import zipfile
+
+    with zipfile.ZipFile(path) as zf:
+        try:
+            info = zf.getinfo(f"{name}.npy")
+        except KeyError:
+            return None
+        if info.compress_type != zipfile.ZIP_STORED:
+            return None
+    with open(path, "rb") as f:
+        # Local file header: 30 fixed bytes, then file name and extra field
+        f.seek(info.header_offset + 26)
+        name_len = int.from_bytes(f.read(2), "little")
+        extra_len = int.from_bytes(f.read(2), "little")
+        f.seek(info.header_offset + 30 + name_len + extra_len)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+    return np.memmap(
+        path, dtype=dtype, mode="r", shape=shape,
+        order="F" if fortran else "C", offset=offset,
+    )
 
 
 def load_topic_similarity_matrix(
     path: str | Path,
+    mmap: bool = True,
 ) -> tuple[list[int], list[str], np.ndarray]:
-    """Load topic similarity matrix from JSON.
+    """Load a topic similarity matrix (``.npz`` archive or JSON).
+
+    With *mmap* (the default), the matrix of an uncompressed ``.npz`` is
+    memory-mapped read-only instead of read into memory; older compressed
+    archives are always read in full.
+
+    A JSON file is parsed once and converted to a sibling ``<path>.npz``
+    archive (float64, so values match the JSON exactly).  The archive
+    records the JSON's size and mtime, and later calls load it only while
+    both still match exactly.
 
     Returns:
         (topic_ids, topic_names, matrix)
     """
-    raw = json.loads(Path(path).read_text())
-    return (
-        raw["topic_ids"],
-        raw["topic_names"],
-        np.array(raw["matrix"]),
-    )
+    if _is_npz_file(path):
+        matrix = _npz_memmap(path, "matrix") if mmap else None
+        with np.load(path, allow_pickle=False) as z:
+            if matrix is None:
+                matrix = z["matrix"]
+            return z["topic_ids"].tolist(), z["topic_names"].tolist(), matrix
+
+    st = os.stat(path)
+    stamp = np.array([st.st_size, st.st_mtime_ns], dtype=np.int64)
+    sidecar = Path(f"{path}.npz")
+    try:
+        with np.load(sidecar, allow_pickle=False) as z:
+            fresh = np.array_equal(z["source_stamp"], stamp)
+        if fresh:
+            return load_topic_similarity_matrix(sidecar, mmap)
+    except Exception:
+        pass  # missing, older or unreadable sidecar: fall back to the JSON
+    raw = _read_json(path)
+    matrix = np.array(raw["matrix"])
+    try:
+        tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as fh:
+            _savez_topic_matrix(
+                fh, raw["topic_ids"], raw["topic_names"], matrix, source_stamp=stamp,
+            )
+        os.replace(tmp, sidecar)
+    except OSError as exc:
+        logger.debug("Could not write %s: %s", sidecar, exc)
+    return raw["topic_ids"], raw["topic_names"], matrix
 
 
 # ---------------------------------------------------------------------------
 # Merge suggestion helper
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
+def _numba_pair_scan():
+    """Build the JIT-compiled merge-candidate scan, or None without Numba.
+
+    The scan fuses the threshold and preference-count tests over the upper
+    triangle in two parallel passes: count the hits per row, then fill each
+    row's slice of the output.  Rows keep their (i, j) order, matching the
+    NumPy path.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    @numba.njit(parallel=True)
+    def scan(sim, counts, thr, min_cnt):
+        n = sim.shape[0]
+        per_row = np.zeros(n, dtype=np.int64)
+        for i in numba.prange(n):
+            hits = 0
+            for j in range(i + 1, n):
+                if sim[i, j] >= thr and (counts[i] <= min_cnt or counts[j] <= min_cnt):
+                    hits += 1
+            per_row[i] = hits
+        starts = np.zeros(n + 1, dtype=np.int64)
+        starts[1:] = np.cumsum(per_row)
+        total = starts[n]
+        iu = np.empty(total, dtype=np.int64)
+        ju = np.empty(total, dtype=np.int64)
+        sims = np.empty(total, dtype=sim.dtype)
+        for i in numba.prange(n):
+            k = starts[i]
+            for j in range(i + 1, n):
+                s = sim[i, j]
+                if s >= thr and (counts[i] <= min_cnt or counts[j] <= min_cnt):
+                    iu[k] = i
+                    ju[k] = j
+                    sims[k] = s
+                    k += 1
+        return iu, ju, sims
+
+    return scan
+
+
 def suggest_topic_merges(
     topics: list[Topic],
     sim_matrix: np.ndarray,
@@ -145,16 +923,29 @@ def suggest_topic_merges(
 
     Returns list of (topic_a, topic_b, similarity_score).
     """
-    suggestions: list[tuple[Topic, Topic, float]] = []
+    sim_matrix = np.asarray(sim_matrix)
+    cnts = np.array([pref_counts.get(t.topic_id, 0) for t in topics], dtype=np.int64)
+
     n = len(topics)
-    for i in range(n):
-        for j in range(i + 1, n):
-            sim = float(sim_matrix[i, j])
-            if sim < sim_threshold:
-                continue
-            cnt_i = pref_counts.get(topics[i].topic_id, 0)
-            cnt_j = pref_counts.get(topics[j].topic_id, 0)
-            if cnt_i <= min_pref_count or cnt_j <= min_pref_count:
-                suggestions.append((topics[i], topics[j], sim))
-    suggestions.sort(key=lambda x: -x[2])
-    return suggestions
+    scan = _numba_pair_scan()
+    if scan is not None:
+        # The kernel is unchecked: a saved matrix may have more rows than
+        # the current topic list, so pass only the part that cnts covers
+        iu, ju, sims = scan(
+            np.ascontiguousarray(sim_matrix[:n, :n]), cnts, sim_threshold, min_pref_count,
+        )
+    else:
+        iu, ju = np.triu_indices(n, k=1)
+        sims = sim_matrix[iu, ju]
+        mask = sims >= sim_threshold
+        iu, ju, sims = iu[mask], ju[mask], sims[mask]
+
+        keep = (cnts[iu] <= min_pref_count) | (cnts[ju] <= min_pref_count)
+        iu, ju, sims = iu[keep], ju[keep], sims[keep]
+
+    # Stable sort keeps (i, j) order among equal similarities
+    order = np.argsort(-sims, kind="stable")
+    return [
+        (topics[i], topics[j], s)
+        for i, j, s in zip(iu[order].tolist(), ju[order].tolist(), sims[order].tolist())
+    ]